@@ -1,12 +1,41 @@
+from __future__ import annotations
+
 import os
 import json
+import html
 import logging
-import nltk
 import re
-import spacy
-from typing import Dict, List, Any, Optional, Union
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from heapq import nlargest
+from itertools import islice
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional, Tuple, Union
 from .indian_kanoon import IndianKanoonAPI
 
+# spaCy takes seconds to import, so it is only imported when a model is
+# first needed
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.matcher import PhraseMatcher
+    from spacy.tokens import Doc
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+# RE2 matches in linear time; the clause patterns below stay within the
+# syntax it shares with re (no lookarounds, inline flags only)
+try:
+    import re2 as _fast_re
+except ImportError:
+    _fast_re = re
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -14,23 +43,312 @@ logging.basicConfig(
 )
 logger = logging.getLogger('legal_brief_analyzer')
 
-# Download necessary NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# spaCy model per device: the transformer pipeline only pays off on a GPU
+SPACY_MODELS = {
+    "cpu": "en_core_web_sm",
+    "cuda": "en_core_web_trf"
+}
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    # If model not found, download it
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# Pipeline components never read by the analyzer, left out at load time
+_EXCLUDED_PIPES = ("lemmatizer",)
+
+def _load_spacy_model(name: str) -> Language:
+    """
+    Load a spaCy model without the components in _EXCLUDED_PIPES,
+    downloading it first if it is not installed.
+    
+    Args:
+        name: The spaCy model package name
+        
+    Returns:
+        The loaded pipeline
+    """
+    import spacy
+    
+    try:
+        return spacy.load(name, exclude=_EXCLUDED_PIPES)
+    except OSError:
+        # If model not found, download it
+        os.system(f"python -m spacy download {name}")
+        return spacy.load(name, exclude=_EXCLUDED_PIPES)
+
+# Loaded pipelines per device, shared by every analyzer instance. Models are
+# only loaded on first use so importing this module stays cheap.
+_PIPELINES: Dict[str, Language] = {}
+_PIPELINES_LOCK = threading.Lock()
+
+def _get_nlp(device: str = "cpu") -> Language:
+    """
+    Get the spaCy pipeline for a device, loading it on first use.
+    
+    Args:
+        device: "cpu" or "cuda"
+        
+    Returns:
+        The loaded pipeline
+    """
+    pipeline = _PIPELINES.get(device)
+    if pipeline is None:
+        with _PIPELINES_LOCK:
+            pipeline = _PIPELINES.get(device)
+            if pipeline is None:
+                if device == "cuda":
+                    import spacy
+                    spacy.require_gpu()
+                pipeline = _load_spacy_model(SPACY_MODELS[device])
+                _PIPELINES[device] = pipeline
+    return pipeline
+
+@lru_cache(maxsize=None)
+def _get_sentencizer() -> Language:
+    """
+    Get a blank English pipeline with only the rule-based sentencizer.
+    
+    Returns:
+        The sentence-splitting pipeline
+    """
+    import spacy
+    
+    sentencizer = spacy.blank("en")
+    sentencizer.add_pipe("sentencizer")
+    return sentencizer
+
+# Batch size for nlp.pipe per device; worker processes only pay off on CPU
+# past the threshold
+PIPE_BATCH_SIZE = {"cpu": 64, "cuda": 32}
+MULTIPROCESS_MIN_BRIEFS = 32
+
+# Common Indian legal acts
+COMMON_ACTS = (
+    "Indian Penal Code", "IPC",
+    "Code of Criminal Procedure", "CrPC",
+    "Code of Civil Procedure", "CPC",
+    "Indian Contract Act",
+    "Indian Evidence Act",
+    "Constitution of India",
+    "Income Tax Act",
+    "Companies Act",
+    "Specific Relief Act",
+    "Arbitration and Conciliation Act",
+    "Consumer Protection Act"
+)
+
+LEGAL_TERMS = (
+    "murder", "theft", "fraud", "negligence", "damages",
+    "contract", "breach", "tort", "liability", "compensation",
+    "injunction", "specific performance", "arbitration", "appeal",
+    "evidence", "testimony", "witness", "jurisdiction", "bail",
+    "conviction", "acquittal", "sentence", "punishment", "rights"
+)
+
+# Entity labels reported for a brief
+_ENTITY_LABELS = ("PERSON", "ORG", "DATE", "LOCATION")
+
+# Precompiled patterns, built once at import instead of on every brief
+_SECTION_NUMBER = r'(\d+(?:\([a-zA-Z0-9]\))?(?:-\d+)?)'
+
+# Acts are found with a PhraseMatcher; these read the section number
+# around a matched act
+# "Act name + Section + number", matched from the end of the act
+_SECTION_AFTER_ACT_RE = re.compile(
+    rf'\s*,?\s*(?:section|sec\.|s\.|§)\s*{_SECTION_NUMBER}', re.IGNORECASE
+)
+# "Section + number + of + Act name", anchored at the start of the act
+_SECTION_BEFORE_ACT_RE = re.compile(
+    rf'(?:section|sec\.|s\.|§)\s*{_SECTION_NUMBER}\s*of\s*the\s*\Z', re.IGNORECASE
+)
+# How far before an act to look for a "Section N of the" prefix
+_SECTION_PREFIX_WINDOW = 80
+# "Act name, Section number" in a document title
+_TITLE_ACT_SECTION_RE = _fast_re.compile(
+    rf'(?i)(.*?),?\s*(?:Section|Sec\.|S\.|§)\s*{_SECTION_NUMBER}'
+)
+
+_AIR_RE = re.compile(r'(\d{4})\s*AIR\s*(\d+)')
+_SCC_RE = re.compile(r'\((\d{4})\)\s*(\d+)\s*SCC\s*(\d+)')
+_SCR_RE = re.compile(r'(\d{4})\s*SCR\s*(\d+)')
+_CITATION_PATTERNS = (_AIR_RE, _SCC_RE, _SCR_RE)
+
+_REPORTER_PATTERNS = {"AIR": _AIR_RE, "SCC": _SCC_RE, "SCR": _SCR_RE}
+
+# Reporter abbreviations locate candidate citations; the full pattern only
+# runs on a small window around each one
+_CITATION_TOKENS_RE = re.compile(r'AIR|SCC|SCR')
+_CITATION_WINDOW = 30
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_HTML_NOISE_RE = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# First sentence of a text, up to its first terminator
+_FIRST_SENTENCE_RE = re.compile(r'\s*(.+?[.!?])(?=\s|$)', re.DOTALL)
+
+# Any holdings indicator followed by the rest of its sentence
+_HOLDINGS_RE = _fast_re.compile(r'(?i)(?:held|conclusion|judgment|order):?\s*(.*?)(?:\.\s*[A-Z]|$)')
+
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{1,2})(?:st|nd|rd|th)?\s+(January|February|March|April|May|June|July|August|September|October|November|December),?\s+(\d{4})',
+    r'(\d{1,2})(?:st|nd|rd|th)?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),?\s+(\d{4})'
+))
+
+# Standardize month names to their abbreviations
+_MONTH_MAP = {
+    'Jan': 'Jan', 'January': 'Jan',
+    'Feb': 'Feb', 'February': 'Feb',
+    'Mar': 'Mar', 'March': 'Mar',
+    'Apr': 'Apr', 'April': 'Apr',
+    'May': 'May',
+    'Jun': 'Jun', 'June': 'Jun',
+    'Jul': 'Jul', 'July': 'Jul',
+    'Aug': 'Aug', 'August': 'Aug',
+    'Sep': 'Sep', 'September': 'Sep',
+    'Oct': 'Oct', 'October': 'Oct',
+    'Nov': 'Nov', 'November': 'Nov',
+    'Dec': 'Dec', 'December': 'Dec'
+}
+
+# Any legal issue indicator followed by the rest of its sentence
+_ISSUE_RE = _fast_re.compile(
+    r'(?i)(?:issue|question|matter|dispute|contention)s?\s+(?:is|are|of)?\s*(.*?)(?:\.\s*[A-Z]|$)'
+)
+
+# One letter per part-of-speech that can form a noun phrase:
+# determiner, modifier, noun. Anything else breaks a phrase.
+_NOUN_PHRASE_POS = {
+    "DET": "D",
+    "ADJ": "A",
+    "NUM": "A",
+    "NOUN": "N",
+    "PROPN": "N"
+}
+_NOUN_PHRASE_RE = re.compile(r'D?A*N+')
+
+def _first_noun_phrase(doc: Doc) -> Optional[str]:
+    """
+    Find the first 2-5 word noun phrase in a POS-tagged Doc.
+    
+    A regex over the tag sequence stands in for doc.noun_chunks, so the
+    dependency parser does not have to run.
+    
+    Args:
+        doc: A Doc with POS tags
+        
+    Returns:
+        The phrase text, or None if there is none
+    """
+    tags = "".join(_NOUN_PHRASE_POS.get(token.pos_, "x") for token in doc)
+    for match in _NOUN_PHRASE_RE.finditer(tags):
+        # One tag per token, so the match length is the phrase length
+        start, end = match.span()
+        if 2 <= end - start <= 5:
+            return doc[start:end].text
+    return None
+
+def _iter_clauses(pattern: Any, text: str) -> Iterator[str]:
+    """
+    Yield the clause captured by each non-overlapping match of pattern.
+    
+    The patterns consume their sentence terminator (RE2 has no lookahead),
+    so each scan resumes where the captured clause ends, not where the
+    match does.
+    
+    Args:
+        pattern: A compiled clause pattern with the clause in group 1
+        text: The text to scan
+    """
+    pos = 0
+    while True:
+        match = pattern.search(text, pos)
+        if match is None:
+            return
+        yield match.group(1)
+        pos = match.end(1)
+
+# Search results are returned most relevant first, at most this many
+MAX_LAW_SECTIONS = 20
+MAX_CASE_HISTORIES = 20
+_BY_RELEVANCE = itemgetter('relevance')
+
+# Templates filled straight from a law section or case history dict
+_SECTION_LABEL = "{title}, Section {sectionNumber}".format_map
+_CASE_LABEL = "{parties} ({citation})".format_map
+_CASE_CHALLENGE = ("The precedent in {parties} may be distinguished on grounds that "
+                   "the factual circumstances differ significantly from the current case.").format_map
+
+# Fallback arguments, challenges and recommendations used by the generators,
+# interned so every analysis shares the same string objects
+_GENERIC_ARGUMENTS = tuple(map(sys.intern, (
+    "The facts presented in the brief clearly establish the elements required for the legal claim.",
+    "The timeline of events demonstrates a clear causal relationship between the actions and the resulting damages.",
+    "The documentary evidence supports the legal position outlined in the brief.",
+    "The opposing party's actions constitute a clear violation of the applicable legal standards.",
+    "The legal precedents consistently support the interpretation of the law as presented in the brief.",
+)))
+_GENERIC_CHALLENGES = tuple(map(sys.intern, (
+    "The evidence presented may be insufficient to establish all elements of the legal claim.",
+    "There may be procedural hurdles that need to be addressed before the substantive issues can be resolved.",
+    "The interpretation of the relevant statutes may be contested by the opposing party.",
+    "The causal connection between the alleged actions and the claimed damages may be difficult to establish.",
+    "The timeline of events may present challenges in establishing the sequence necessary for the legal claim.",
+)))
+_GENERAL_RECOMMENDATIONS = tuple(map(sys.intern, (
+    "Gather and organize all documentary evidence that supports the factual claims made in the brief.",
+    "Consider obtaining expert testimony to strengthen the technical aspects of the case.",
+    "Prepare for potential settlement discussions, as many cases are resolved before trial.",
+    "Develop counter-arguments to address the potential challenges identified above.",
+    "Ensure all procedural requirements are met to avoid unnecessary delays in the legal proceedings.",
+)))
+
+# Indian Kanoon responses are effectively immutable within a day. The
+# persistent cache is only used when KANOON_CACHE_PATH is set.
+KANOON_CACHE_TTL = 86400
+KANOON_CACHE_PATH = os.environ.get("KANOON_CACHE_PATH", "")
+
+# Searches and document fetches are blocking HTTP calls, so they are
+# overlapped on a shared thread pool
+KANOON_MAX_WORKERS = 16
+_KANOON_POOL = ThreadPoolExecutor(max_workers=KANOON_MAX_WORKERS, thread_name_prefix="kanoon")
+
+class KanoonResponseCache:
+    """
+    Persistent SQLite cache for Indian Kanoon API responses, so that repeated
+    searches and document fetches survive process restarts. Expired rows are
+    deleted whenever the cache is opened.
+    """
+    
+    def __init__(self, path: str, ttl: int = KANOON_CACHE_TTL):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path of the SQLite database file
+            ttl: Maximum age in seconds of a usable cache entry
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)")
+            self._conn.execute("DELETE FROM responses WHERE ts < ?", (time.time() - self.ttl,))
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for a key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, ts FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+    
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a response under a key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()))
 
 class LegalBriefAnalyzer:
     """
@@ -38,19 +356,123 @@ class LegalBriefAnalyzer:
     for the Indian Kanoon API.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, device: str = "cpu"):
         """
         Initialize the Legal Brief Analyzer.
         
         Args:
             api_key: The API key for Indian Kanoon
+            device: "cpu", or "cuda" to run the transformer pipeline on a GPU
         """
+        if device not in SPACY_MODELS:
+            raise ValueError(f"Unsupported device: {device}")
+        
         self.api_client = IndianKanoonAPI(api_key)
-        self.stopwords = set(nltk.corpus.stopwords.words('english'))
-        # Add legal stopwords
-        self.stopwords.update(['court', 'case', 'plaintiff', 'defendant', 'petitioner', 'respondent'])
+        self.response_cache = None
+        if KANOON_CACHE_PATH:
+            try:
+                self.response_cache = KanoonResponseCache(KANOON_CACHE_PATH)
+            except (OSError, sqlite3.Error) as e:
+                logger.error(f"Indian Kanoon response cache disabled: {str(e)}")
+        self.device = device
         logger.info("Legal Brief Analyzer initialized")
     
+    @cached_property
+    def nlp(self) -> Language:
+        """The spaCy pipeline for this analyzer's device, loaded on first use."""
+        return _get_nlp(self.device)
+    
+    @cached_property
+    def chunk_unused_pipes(self) -> List[str]:
+        """Pipeline components to skip when only noun phrases are read."""
+        # Noun phrases come from POS tags (tagger and attribute_ruler); the
+        # parse and entities are never read
+        return [name for name in ("parser", "ner") if name in self.nlp.pipe_names]
+    
+    @cached_property
+    def act_matcher(self) -> PhraseMatcher:
+        """Case-insensitive matcher for COMMON_ACTS over a parsed brief."""
+        from spacy.matcher import PhraseMatcher
+        
+        matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        matcher.add("ACT", [self.nlp.make_doc(act) for act in COMMON_ACTS])
+        return matcher
+    
+    @cached_property
+    def term_matcher(self) -> PhraseMatcher:
+        """Case-insensitive matcher for LEGAL_TERMS, keyed by term."""
+        from spacy.matcher import PhraseMatcher
+        
+        matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for term in LEGAL_TERMS:
+            matcher.add(term, [self.nlp.make_doc(term)])
+        return matcher
+    
+    def warmup(self) -> None:
+        """
+        Load the spaCy pipelines and build the matchers ahead of the first brief.
+        
+        Models are loaded lazily, so without this the first analyze_brief call
+        in a fresh process also pays for loading them.
+        """
+        self.nlp("warmup")
+        self._build_matchers()
+        _get_sentencizer()
+    
+    def _build_matchers(self) -> Tuple[PhraseMatcher, PhraseMatcher]:
+        """
+        Build the act and term matchers, which are cached on first access.
+        
+        Returns:
+            Tuple of the act matcher and the term matcher
+        """
+        return self.act_matcher, self.term_matcher
+    
+    def _cached_search(self, query: str, doc_types: str, max_cites: int) -> Dict[str, Any]:
+        """
+        Search Indian Kanoon, serving repeated queries from the response cache.
+        
+        Args:
+            query: The search query
+            doc_types: Document types to search
+            max_cites: Maximum number of citations per document
+            
+        Returns:
+            Dict containing search results
+        """
+        if self.response_cache is None:
+            return self.api_client.search(query, doc_types=doc_types, max_cites=max_cites)
+        
+        key = json.dumps(["search", query, doc_types, max_cites])
+        results = self.response_cache.get(key)
+        if results is None:
+            results = self.api_client.search(query, doc_types=doc_types, max_cites=max_cites)
+            # Never cache failed requests
+            if 'error' not in results:
+                self.response_cache.put(key, results)
+        return results
+    
+    def _cached_get_document(self, tid: Any) -> Dict[str, Any]:
+        """
+        Retrieve a document, serving repeated fetches from the response cache.
+        
+        Args:
+            tid: The document ID
+            
+        Returns:
+            Dict containing the document data
+        """
+        if self.response_cache is None:
+            return self.api_client.get_document(tid)
+        
+        key = json.dumps(["doc", str(tid)])
+        doc_details = self.response_cache.get(key)
+        if doc_details is None:
+            doc_details = self.api_client.get_document(tid)
+            if 'error' not in doc_details:
+                self.response_cache.put(key, doc_details)
+        return doc_details
+    
     def analyze_brief(self, brief_text: str) -> Dict[str, Any]:
         """
         Analyze a legal brief and extract relevant information.
@@ -63,17 +485,68 @@ class LegalBriefAnalyzer:
         """
         logger.info("Analyzing legal brief")
         
+        # Run the spaCy pipeline once and share the Doc between helpers
+        doc = self.nlp(brief_text)
+        
+        return self._analyze_from_doc(brief_text, doc)
+    
+    def analyze_briefs(self, brief_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze several legal briefs, batching them through the spaCy pipeline.
+        
+        Args:
+            brief_texts: The texts of the legal briefs
+            
+        Returns:
+            List of analysis dicts, in the same order as brief_texts
+        """
+        logger.info(f"Analyzing {len(brief_texts)} legal briefs")
+        
+        docs = self.nlp.pipe(brief_texts, batch_size=PIPE_BATCH_SIZE[self.device],
+                             n_process=self._n_process(len(brief_texts)))
+        return [self._analyze_from_doc(text, doc) for text, doc in zip(brief_texts, docs)]
+    
+    def _n_process(self, n_texts: int) -> int:
+        """
+        Choose the number of nlp.pipe worker processes for a batch.
+        
+        Args:
+            n_texts: The number of texts in the batch
+            
+        Returns:
+            The number of processes, 1 to parse in this process
+        """
+        # Process start-up and IPC outweigh the gain on small batches, and
+        # GPU batches are already parallel
+        if self.device == "cpu" and n_texts > MULTIPROCESS_MIN_BRIEFS:
+            return max(1, (os.cpu_count() or 1) - 1)
+        return 1
+    
+    def _analyze_from_doc(self, brief_text: str, doc: Doc) -> Dict[str, Any]:
+        """
+        Run the analysis steps on a brief that has already been parsed.
+        
+        Args:
+            brief_text: The text of the legal brief
+            doc: The parsed brief
+            
+        Returns:
+            Dict containing extracted information and search results
+        """
         # Extract key entities and concepts
-        entities = self._extract_entities(brief_text)
+        entities = self._extract_entities(doc)
+        
+        # Extract legal terms once; queries, issues and the summary share them
+        legal_terms = self._extract_legal_terms(doc)
         
         # Extract legal acts and sections
-        acts_sections = self._extract_acts_sections(brief_text)
+        acts_sections = self._extract_acts_sections(brief_text, doc)
         
         # Extract case citations
         citations = self._extract_citations(brief_text)
         
         # Generate search queries
-        queries = self._generate_search_queries(brief_text, entities, acts_sections, citations)
+        queries = self._generate_search_queries(brief_text, doc, entities, acts_sections, citations, legal_terms)
         
         # Search for relevant law sections
         law_sections = self._search_law_sections(queries, acts_sections)
@@ -82,7 +555,7 @@ class LegalBriefAnalyzer:
         case_histories = self._search_case_histories(queries, citations)
         
         # Generate legal analysis
-        analysis = self._generate_analysis(brief_text, law_sections, case_histories)
+        analysis = self._generate_analysis(brief_text, doc, law_sections, case_histories, legal_terms)
         
         return {
             "entities": entities,
@@ -93,92 +566,61 @@ class LegalBriefAnalyzer:
             "analysis": analysis
         }
     
-    def _extract_entities(self, text: str) -> Dict[str, List[str]]:
+    def _extract_entities(self, doc: Doc) -> Dict[str, List[str]]:
         """
         Extract named entities from the brief text.
         
         Args:
-            text: The brief text
+            doc: The parsed brief
             
         Returns:
             Dict of entity types and their values
         """
-        doc = nlp(text)
-        entities = {}
+        strings = doc.vocab.strings
+        # Compare integer label IDs instead of resolving ent.label_ per entity
+        wanted = {strings[label]: label for label in _ENTITY_LABELS}
+        # Insertion-ordered sets of entity texts per label
+        entities = {label: {} for label in _ENTITY_LABELS}
         
         for ent in doc.ents:
-            if ent.label_ not in entities:
-                entities[ent.label_] = []
-            if ent.text not in entities[ent.label_]:
-                entities[ent.label_].append(ent.text)
-        
-        # Extract legal entities using regex patterns
-        legal_entities = {
-            "PERSON": [],
-            "ORG": [],
-            "DATE": [],
-            "LOCATION": []
-        }
-        
-        # Merge spaCy entities with regex-extracted entities
-        for key in legal_entities:
-            if key in entities:
-                legal_entities[key].extend(entities[key])
+            label = wanted.get(ent.label)
+            if label is not None:
+                entities[label][ent.text] = None
         
-        return legal_entities
+        return {label: list(values) for label, values in entities.items()}
     
-    def _extract_acts_sections(self, text: str) -> List[Dict[str, str]]:
+    def _extract_acts_sections(self, text: str, doc: Doc) -> List[Dict[str, str]]:
         """
         Extract references to legal acts and sections.
         
         Args:
             text: The brief text
+            doc: The parsed brief
             
         Returns:
             List of dicts containing act names and section numbers
         """
-        # Common Indian legal acts
-        common_acts = [
-            "Indian Penal Code", "IPC", 
-            "Code of Criminal Procedure", "CrPC",
-            "Code of Civil Procedure", "CPC",
-            "Indian Contract Act",
-            "Indian Evidence Act",
-            "Constitution of India",
-            "Income Tax Act",
-            "Companies Act",
-            "Specific Relief Act",
-            "Arbitration and Conciliation Act",
-            "Consumer Protection Act"
-        ]
+        act_spans = [doc[start:end] for _, start, end in self.act_matcher(doc)]
         
         acts_sections = []
         
-        # Pattern for "Act name + Section + number"
-        act_section_pattern = r'(?i)({})\s*,?\s*(?:section|sec\.|s\.|§)\s*(\d+(?:\([a-zA-Z0-9]\))?(?:-\d+)?)'
-        
-        # Search for each act
-        for act in common_acts:
-            pattern = act_section_pattern.format(re.escape(act))
-            matches = re.finditer(pattern, text)
-            
-            for match in matches:
+        # "Act name + Section + number"
+        for span in act_spans:
+            match = _SECTION_AFTER_ACT_RE.match(text, span.end_char)
+            if match:
                 acts_sections.append({
-                    "act": match.group(1),
-                    "section": match.group(2)
+                    "act": span.text,
+                    "section": match.group(1)
                 })
         
-        # Pattern for "Section + number + of + Act name"
-        section_act_pattern = r'(?i)(?:section|sec\.|s\.|§)\s*(\d+(?:\([a-zA-Z0-9]\))?(?:-\d+)?)\s*of\s*the\s*({})'
-        
-        # Search for each act
-        for act in common_acts:
-            pattern = section_act_pattern.format(re.escape(act))
-            matches = re.finditer(pattern, text)
-            
-            for match in matches:
+        # "Section + number + of + Act name"
+        for span in act_spans:
+            match = _SECTION_BEFORE_ACT_RE.search(
+                text, max(0, span.start_char - _SECTION_PREFIX_WINDOW), span.start_char
+            )
+            if match:
                 acts_sections.append({
-                    "act": match.group(2),
+                    "act": span.text,
                     "section": match.group(1)
                 })
         
@@ -194,64 +636,59 @@ class LegalBriefAnalyzer:
         Returns:
             List of dicts containing citation information
         """
-        citations = []
-        
-        # Pattern for AIR citations
-        air_pattern = r'(\d{4})\s*AIR\s*(\d+)'
-        air_matches = re.finditer(air_pattern, text)
-        for match in air_matches:
-            citations.append({
-                "type": "AIR",
-                "year": match.group(1),
-                "page": match.group(2)
-            })
-        
-        # Pattern for SCC citations
-        scc_pattern = r'\((\d{4})\)\s*(\d+)\s*SCC\s*(\d+)'
-        scc_matches = re.finditer(scc_pattern, text)
-        for match in scc_matches:
-            citations.append({
-                "type": "SCC",
-                "year": match.group(1),
-                "volume": match.group(2),
-                "page": match.group(3)
-            })
-        
-        # Pattern for SCR citations
-        scr_pattern = r'(\d{4})\s*SCR\s*(\d+)'
-        scr_matches = re.finditer(scr_pattern, text)
-        for match in scr_matches:
-            citations.append({
-                "type": "SCR",
-                "year": match.group(1),
-                "page": match.group(2)
-            })
+        by_reporter = {"AIR": [], "SCC": [], "SCR": []}
+        
+        for token in _CITATION_TOKENS_RE.finditer(text):
+            reporter = token.group()
+            window_start = max(0, token.start() - _CITATION_WINDOW)
+            window_end = token.end() + _CITATION_WINDOW
+            
+            # Only accept the citation built around this token
+            for match in _REPORTER_PATTERNS[reporter].finditer(text, window_start, window_end):
+                if match.start() <= token.start() and match.end() >= token.end():
+                    if reporter == "SCC":
+                        citation = {
+                            "type": "SCC",
+                            "year": match.group(1),
+                            "volume": match.group(2),
+                            "page": match.group(3)
+                        }
+                    else:
+                        citation = {
+                            "type": reporter,
+                            "year": match.group(1),
+                            "page": match.group(2)
+                        }
+                    by_reporter[reporter].append(citation)
+                    break
+        
+        # Keep the AIR, SCC, SCR grouping of the per-reporter scans
+        citations = by_reporter["AIR"] + by_reporter["SCC"] + by_reporter["SCR"]
         
         return citations
     
-    def _generate_search_queries(self, text: str, entities: Dict[str, List[str]], 
+    def _generate_search_queries(self, text: str, doc: Doc, entities: Dict[str, List[str]], 
                                acts_sections: List[Dict[str, str]], 
-                               citations: List[Dict[str, str]]) -> List[str]:
+                               citations: List[Dict[str, str]],
+                               legal_terms: List[str]) -> List[str]:
         """
         Generate search queries based on the brief analysis.
         
         Args:
             text: The brief text
+            doc: The parsed brief
             entities: Extracted entities
             acts_sections: Extracted acts and sections
             citations: Extracted citations
+            legal_terms: Legal terms found in the brief
             
         Returns:
             List of search queries
         """
-        queries = []
-        
-        # Tokenize and clean the text
-        tokens = nltk.word_tokenize(text.lower())
-        tokens = [token for token in tokens if token.isalnum() and token not in self.stopwords]
+        # Insertion-ordered set of queries
+        queries = {}
         
         # Extract key phrases using TextRank-like algorithm
-        doc = nlp(text)
         key_phrases = []
         for chunk in doc.noun_chunks:
             if len(chunk.text.split()) >= 2 and len(chunk.text.split()) <= 5:
@@ -259,58 +696,46 @@ class LegalBriefAnalyzer:
         
         # Add key phrases to queries
         for phrase in key_phrases[:5]:  # Limit to top 5 phrases
-            queries.append(phrase)
+            queries[phrase] = None
         
         # Add act and section specific queries
         for item in acts_sections:
-            queries.append(f"{item['act']} section {item['section']}")
+            queries[f"{item['act']} section {item['section']}"] = None
         
         # Add citation specific queries
         for item in citations:
             if item['type'] == 'AIR':
-                queries.append(f"{item['year']} AIR {item['page']}")
+                queries[f"{item['year']} AIR {item['page']}"] = None
             elif item['type'] == 'SCC':
-                queries.append(f"({item['year']}) {item['volume']} SCC {item['page']}")
+                queries[f"({item['year']}) {item['volume']} SCC {item['page']}"] = None
             elif item['type'] == 'SCR':
-                queries.append(f"{item['year']} SCR {item['page']}")
+                queries[f"{item['year']} SCR {item['page']}"] = None
         
-        # Add entity-based queries
-        for entity_type, values in entities.items():
-            if entity_type in ['PERSON', 'ORG'] and values:
-                for value in values[:3]:  # Limit to top 3 entities per type
-                    # Combine with key legal terms from the brief
-                    legal_terms = self._extract_legal_terms(text)
-                    if legal_terms:
-                        queries.append(f"{value} {legal_terms[0]}")
+        # Add entity-based queries, combined with the top legal term of the brief
+        if legal_terms:
+            for entity_type, values in entities.items():
+                if entity_type in ['PERSON', 'ORG'] and values:
+                    for value in values[:3]:  # Limit to top 3 entities per type
+                        queries[f"{value} {legal_terms[0]}"] = None
         
-        # Remove duplicates and limit to reasonable number
-        unique_queries = list(set(queries))
-        return unique_queries[:10]  # Limit to top 10 queries
+        # Limit to reasonable number
+        return list(queries)[:10]  # Limit to top 10 queries
     
-    def _extract_legal_terms(self, text: str) -> List[str]:
+    def _extract_legal_terms(self, doc: Doc) -> List[str]:
         """
         Extract common legal terms from the text.
         
         Args:
-            text: The brief text
+            doc: The parsed brief
             
         Returns:
             List of legal terms
         """
-        legal_terms = [
-            "murder", "theft", "fraud", "negligence", "damages", 
-            "contract", "breach", "tort", "liability", "compensation",
-            "injunction", "specific performance", "arbitration", "appeal",
-            "evidence", "testimony", "witness", "jurisdiction", "bail",
-            "conviction", "acquittal", "sentence", "punishment", "rights"
-        ]
-        
-        found_terms = []
-        for term in legal_terms:
-            if re.search(r'\b' + re.escape(term) + r'\b', text, re.IGNORECASE):
-                found_terms.append(term)
+        strings = doc.vocab.strings
+        found = {strings[match_id] for match_id, _, _ in self.term_matcher(doc)}
         
-        return found_terms
+        # Keep the canonical term order
+        return [term for term in LEGAL_TERMS if term in found]
     
     def _search_law_sections(self, queries: List[str], 
                            acts_sections: List[Dict[str, str]]) -> List[Dict[str, Any]]:
@@ -325,62 +750,67 @@ class LegalBriefAnalyzer:
             List of relevant law sections
         """
         law_sections = []
-        
-        # First, search for specific acts and sections
-        for item in acts_sections:
-            query = f"{item['act']} section {item['section']}"
-            try:
-                results = self.api_client.search(query, doc_types="laws", max_cites=5)
-                
-                if 'docs' in results and results['docs']:
-                    for doc in results['docs'][:3]:  # Limit to top 3 results per query
-                        # Get full document to extract the section content
-                        if 'tid' in doc:
-                            doc_details = self.api_client.get_document(doc['tid'])
-                            if 'doc' in doc_details:
-                                law_sections.append({
-                                    "title": item['act'],
-                                    "sectionNumber": item['section'],
-                                    "content": self._extract_clean_content(doc_details['doc']),
-                                    "relevance": 9,  # High relevance for exact matches
-                                    "source": "Indian Kanoon",
-                                    "docId": doc['tid']
-                                })
-            except Exception as e:
-                logger.error(f"Error searching for law section: {str(e)}")
-        
-        # Then, search for general legal concepts
-        for query in queries:
-            if not any(query == f"{item['act']} section {item['section']}" for item in acts_sections):
-                try:
-                    results = self.api_client.search(query, doc_types="laws", max_cites=5)
+        # Document IDs already in law_sections
+        seen_tids = set()
+        
+        exact_queries = [f"{item['act']} section {item['section']}" for item in acts_sections]
+        exact_query_set = set(exact_queries)
+        concept_queries = [query for query in queries if query not in exact_query_set]
+        
+        # Bound methods used in the loops below
+        result_docs = self._result_docs
+        append = law_sections.append
+        mark_seen = seen_tids.add
+        
+        # Issue every search, then every document fetch, concurrently
+        results = self._search_many(exact_queries + concept_queries, "laws")
+        documents = self._fetch_documents(
+            [doc['tid'] for query in exact_queries for doc in result_docs(results[query], 3) if 'tid' in doc]
+            + [doc['tid'] for query in concept_queries for doc in result_docs(results[query], 2) if 'tid' in doc]
+        )
+        
+        # Strip each document's HTML once, however many fields read it
+        clean = self._extract_clean_content
+        contents = {tid: clean(details['doc']) for tid, details in documents.items() if 'doc' in details}
+        
+        # First, specific acts and sections
+        for item, query in zip(acts_sections, exact_queries):
+            for doc in result_docs(results[query], 3):  # Limit to top 3 results per query
+                # Only documents that were fetched successfully
+                tid = doc.get('tid')
+                if tid in contents:
+                    append({
+                        "title": item['act'],
+                        "sectionNumber": item['section'],
+                        "content": contents[tid],
+                        "relevance": 9,  # High relevance for exact matches
+                        "source": "Indian Kanoon",
+                        "docId": tid
+                    })
+                    mark_seen(tid)
+        
+        # Then, general legal concepts
+        parse_title = self._parse_act_section_from_title
+        for query in concept_queries:
+            for doc in result_docs(results[query], 2):  # Limit to top 2 results per query
+                # Skip documents already included or not fetched
+                tid = doc.get('tid')
+                if tid not in seen_tids and tid in contents:
+                    # Extract act and section from title
+                    act_section = parse_title(doc.get('title', ''))
                     
-                    if 'docs' in results and results['docs']:
-                        for doc in results['docs'][:2]:  # Limit to top 2 results per query
-                            # Check if this document is already included
-                            if not any(section.get('docId') == doc.get('tid') for section in law_sections):
-                                # Get full document
-                                if 'tid' in doc:
-                                    doc_details = self.api_client.get_document(doc['tid'])
-                                    if 'doc' in doc_details:
-                                        # Extract act and section from title
-                                        act_section = self._parse_act_section_from_title(doc.get('title', ''))
-                                        
-                                        law_sections.append({
-                                            "title": act_section.get('act', doc.get('title', 'Unknown Act')),
-                                            "sectionNumber": act_section.get('section', 'N/A'),
-                                            "content": self._extract_clean_content(doc_details['doc']),
-                                            "relevance": 7,  # Medium relevance for concept matches
-                                            "source": "Indian Kanoon",
-                                            "docId": doc['tid']
-                                        })
-                except Exception as e:
-                    logger.error(f"Error searching for law section: {str(e)}")
-        
-        # Sort by relevance
-        law_sections.sort(key=lambda x: x['relevance'], reverse=True)
-        
-        return law_sections
+                    append({
+                        "title": act_section.get('act', doc.get('title', 'Unknown Act')),
+                        "sectionNumber": act_section.get('section', 'N/A'),
+                        "content": contents[tid],
+                        "relevance": 7,  # Medium relevance for concept matches
+                        "source": "Indian Kanoon",
+                        "docId": tid
+                    })
+                    mark_seen(tid)
+        
+        # Most relevant first, capped
+        return nlargest(MAX_LAW_SECTIONS, law_sections, key=_BY_RELEVANCE)
     
     def _search_case_histories(self, queries: List[str], 
                              citations: List[Dict[str, str]]) -> List[Dict[str, Any]]:
@@ -395,8 +825,10 @@ class LegalBriefAnalyzer:
             List of relevant case histories
         """
         case_histories = []
+        # Document IDs already in case_histories
+        seen_tids = set()
         
-        # First, search for specific citations
+        citation_queries = []
         for item in citations:
             citation_str = ""
             if item['type'] == 'AIR':
@@ -405,63 +837,122 @@ class LegalBriefAnalyzer:
                 citation_str = f"({item['year']}) {item['volume']} SCC {item['page']}"
             elif item['type'] == 'SCR':
                 citation_str = f"{item['year']} SCR {item['page']}"
+            citation_queries.append(citation_str)
+        
+        # Bound methods used in the loops below
+        result_docs = self._result_docs
+        extract_holdings = self._extract_holdings
+        extract_date = self._extract_date
+        append = case_histories.append
+        mark_seen = seen_tids.add
+        
+        # Issue every search, then every document fetch, concurrently
+        results = self._search_many(citation_queries + queries, "judgments")
+        documents = self._fetch_documents(
+            [doc['tid'] for query in citation_queries + queries
+             for doc in result_docs(results[query], 2) if 'tid' in doc]
+        )
+        
+        # Strip each document's HTML once, however many fields read it
+        clean = self._extract_clean_content
+        contents = {tid: clean(details['doc']) for tid, details in documents.items() if 'doc' in details}
+        
+        # First, specific citations
+        for citation_str in citation_queries:
+            for doc in result_docs(results[citation_str], 2):  # Limit to top 2 results per citation
+                # Only documents that were fetched successfully
+                tid = doc.get('tid')
+                if tid in contents:
+                    content = contents[tid]
+                    append({
+                        "citation": citation_str,
+                        "parties": doc.get('title', 'Unknown Parties'),
+                        "holdings": extract_holdings(content),
+                        "relevance": 9,  # High relevance for exact citation matches
+                        "date": extract_date(content),
+                        "source": "Indian Kanoon",
+                        "docId": tid
+                    })
+                    mark_seen(tid)
+        
+        # Then, general legal concepts in case law
+        extract_citation = self._extract_citation
+        for query in queries:
+            for doc in result_docs(results[query], 2):  # Limit to top 2 results per query
+                # Skip documents already included or not fetched
+                tid = doc.get('tid')
+                if tid not in seen_tids and tid in contents:
+                    content = contents[tid]
+                    # Extract citation from metadata
+                    citation = extract_citation(content)
+                    
+                    append({
+                        "citation": citation if citation else doc.get('docsource', 'Unknown Citation'),
+                        "parties": doc.get('title', 'Unknown Parties'),
+                        "holdings": extract_holdings(content),
+                        "relevance": 7,  # Medium relevance for concept matches
+                        "date": extract_date(content),
+                        "source": "Indian Kanoon",
+                        "docId": tid
+                    })
+                    mark_seen(tid)
+        
+        # Most relevant first, capped
+        return nlargest(MAX_CASE_HISTORIES, case_histories, key=_BY_RELEVANCE)
+    
+    def _search_many(self, queries: List[str], doc_types: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several searches concurrently on the shared Indian Kanoon pool.
+        
+        Args:
+            queries: The search queries
+            doc_types: Document types to search
             
+        Returns:
+            Dict mapping each query to its search results
+        """
+        def search(query: str) -> Dict[str, Any]:
             try:
-                results = self.api_client.search(citation_str, doc_types="judgments", max_cites=5)
-                
-                if 'docs' in results and results['docs']:
-                    for doc in results['docs'][:2]:  # Limit to top 2 results per citation
-                        # Get full document to extract the case details
-                        if 'tid' in doc:
-                            doc_details = self.api_client.get_document(doc['tid'])
-                            if 'doc' in doc_details:
-                                # Extract parties from title
-                                parties = doc.get('title', 'Unknown Parties')
-                                
-                                case_histories.append({
-                                    "citation": citation_str,
-                                    "parties": parties,
-                                    "holdings": self._extract_holdings(doc_details['doc']),
-                                    "relevance": 9,  # High relevance for exact citation matches
-                                    "date": self._extract_date(doc_details['doc']),
-                                    "source": "Indian Kanoon",
-                                    "docId": doc['tid']
-                                })
+                return self._cached_search(query, doc_types, 5)
             except Exception as e:
-                logger.error(f"Error searching for case history: {str(e)}")
+                logger.error(f"Error searching Indian Kanoon: {str(e)}")
+                return {}
         
-        # Then, search for general legal concepts in case law
-        for query in queries:
+        unique_queries = list(dict.fromkeys(queries))
+        return dict(zip(unique_queries, _KANOON_POOL.map(search, unique_queries)))
+    
+    def _fetch_documents(self, tids: List[Any]) -> Dict[Any, Dict[str, Any]]:
+        """
+        Retrieve several documents concurrently on the shared Indian Kanoon pool.
+        
+        Args:
+            tids: The document IDs
+            
+        Returns:
+            Dict mapping each document ID to its document data
+        """
+        def fetch(tid: Any) -> Dict[str, Any]:
             try:
-                results = self.api_client.search(query, doc_types="judgments", max_cites=5)
-                
-                if 'docs' in results and results['docs']:
-                    for doc in results['docs'][:2]:  # Limit to top 2 results per query
-                        # Check if this document is already included
-                        if not any(case.get('docId') == doc.get('tid') for case in case_histories):
-                            # Get full document
-                            if 'tid' in doc:
-                                doc_details = self.api_client.get_document(doc['tid'])
-                                if 'doc' in doc_details:
-                                    # Extract citation from metadata
-                                    citation = self._extract_citation(doc_details['doc'])
-                                    
-                                    case_histories.append({
-                                        "citation": citation if citation else doc.get('docsource', 'Unknown Citation'),
-                                        "parties": doc.get('title', 'Unknown Parties'),
-                                        "holdings": self._extract_holdings(doc_details['doc']),
-                                        "relevance": 7,  # Medium relevance for concept matches
-                                        "date": self._extract_date(doc_details['doc']),
-                                        "source": "Indian Kanoon",
-                                        "docId": doc['tid']
-                                    })
+                return self._cached_get_document(tid)
             except Exception as e:
-                logger.error(f"Error searching for case history: {str(e)}")
+                logger.error(f"Error retrieving document: {str(e)}")
+                return {}
         
-        # Sort by relevance
-        case_histories.sort(key=lambda x: x['relevance'], reverse=True)
-        
-        return case_histories
+        unique_tids = list(dict.fromkeys(tids))
+        return dict(zip(unique_tids, _KANOON_POOL.map(fetch, unique_tids)))
+    
+    @staticmethod
+    def _result_docs(results: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Return the top documents of a search response, or an empty list."""
+        return (results.get('docs') or [])[:limit]
+    
+    @staticmethod
+    def _result_labels(law_sections: List[Dict[str, Any]],
+                       case_histories: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+        """Return the display labels of the top 3 law sections and case histories."""
+        section_labels = [_SECTION_LABEL(section) for section in law_sections[:3]]
+        case_labels = [_CASE_LABEL(case) for case in case_histories[:3]]
+        return section_labels, case_labels
     
     def _parse_act_section_from_title(self, title: str) -> Dict[str, str]:
         """
@@ -475,9 +966,7 @@ class LegalBriefAnalyzer:
         """
         result = {"act": "", "section": ""}
         
-        # Pattern for "Act name, Section number"
-        act_section_pattern = r'(.*?),?\s*(?:Section|Sec\.|S\.|§)\s*(\d+(?:\([a-zA-Z0-9]\))?(?:-\d+)?)'
-        match = re.search(act_section_pattern, title, re.IGNORECASE)
+        match = _TITLE_ACT_SECTION_RE.search(title)
         
         if match:
             result["act"] = match.group(1).strip()
@@ -497,119 +986,85 @@ class LegalBriefAnalyzer:
         Returns:
             Clean text content
         """
-        # Simple HTML tag removal (for more complex cases, use BeautifulSoup)
-        text = re.sub(r'<[^>]+>', ' ', html_content)
+        if HTMLParser is not None:
+            tree = HTMLParser(html_content)
+            tree.strip_tags(['script', 'style'])
+            text = tree.text(separator=' ')
+        else:
+            # Drop scripts, styles and comments, then the remaining tags
+            text = _HTML_NOISE_RE.sub(' ', html_content)
+            text = html.unescape(_TAG_RE.sub(' ', text))
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         # Limit to reasonable length
         if len(text) > 1000:
             text = text[:997] + "..."
         
         return text
     
-    def _extract_holdings(self, html_content: str) -> str:
+    def _extract_holdings(self, text: str) -> str:
         """
         Extract the holdings (main decision) from a case document.
         
         Args:
-            html_content: HTML content of the case document
+            text: Clean text content of the case document
             
         Returns:
             Extracted holdings
         """
-        # Clean HTML
-        text = self._extract_clean_content(html_content)
-        
-        # Look for sections that might contain holdings
-        holdings_patterns = [
-            r'(?i)held:?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)conclusion:?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)judgment:?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)order:?\s*(.*?)(?=\.\s*[A-Z]|\Z)'
-        ]
-        
-        for pattern in holdings_patterns:
-            match = re.search(pattern, text)
-            if match and len(match.group(1)) > 50:  # Ensure it's substantial
-                return match.group(1).strip()
+        # Look for sections that might contain holdings, in a single pass
+        for holding in _iter_clauses(_HOLDINGS_RE, text):
+            if len(holding) > 50:  # Ensure it's substantial
+                return holding.strip()
         
         # If no specific holdings found, return a summary of the last part of the document
-        sentences = nltk.sent_tokenize(text)
+        sentences = [sent.text for sent in _get_sentencizer()(text).sents]
         if len(sentences) > 5:
             return " ".join(sentences[-5:])
         
         return text[:500] + "..." if len(text) > 500 else text
     
-    def _extract_date(self, html_content: str) -> str:
+    def _extract_date(self, text: str) -> str:
         """
         Extract the date from a case document.
         
         Args:
-            html_content: HTML content of the case document
+            text: Clean text content of the case document
             
         Returns:
             Extracted date in DD MMM YYYY format
         """
-        # Clean HTML
-        text = self._extract_clean_content(html_content)
-        
         # Look for date patterns
-        date_patterns = [
-            r'(\d{1,2})(?:st|nd|rd|th)?\s+(January|February|March|April|May|June|July|August|September|October|November|December),?\s+(\d{4})',
-            r'(\d{1,2})(?:st|nd|rd|th)?\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),?\s+(\d{4})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 day = match.group(1)
                 month = match.group(2)
                 year = match.group(3)
                 
-                # Standardize month abbreviations
-                month_map = {
-                    'Jan': 'Jan', 'January': 'Jan',
-                    'Feb': 'Feb', 'February': 'Feb',
-                    'Mar': 'Mar', 'March': 'Mar',
-                    'Apr': 'Apr', 'April': 'Apr',
-                    'May': 'May',
-                    'Jun': 'Jun', 'June': 'Jun',
-                    'Jul': 'Jul', 'July': 'Jul',
-                    'Aug': 'Aug', 'August': 'Aug',
-                    'Sep': 'Sep', 'September': 'Sep',
-                    'Oct': 'Oct', 'October': 'Oct',
-                    'Nov': 'Nov', 'November': 'Nov',
-                    'Dec': 'Dec', 'December': 'Dec'
-                }
-                
-                standardized_month = month_map.get(month, month)
+                standardized_month = _MONTH_MAP.get(month, month)
                 return f"{day} {standardized_month} {year}"
         
         # If no date found, return empty string
         return ""
     
-    def _extract_citation(self, html_content: str) -> str:
+    def _extract_citation(self, text: str) -> str:
         """
         Extract citation from a case document.
         
         Args:
-            html_content: HTML content of the case document
+            text: Clean text content of the case document
             
         Returns:
             Extracted citation
         """
-        # Clean HTML
-        text = self._extract_clean_content(html_content)
+        # Most documents carry no reporter citation at all
+        if _CITATION_TOKENS_RE.search(text) is None:
+            return ""
         
         # Look for citation patterns
-        citation_patterns = [
-            r'(\d{4})\s*AIR\s*(\d+)',
-            r'\((\d{4})\)\s*(\d+)\s*SCC\s*(\d+)',
-            r'(\d{4})\s*SCR\s*(\d+)'
-        ]
-        
-        for pattern in citation_patterns:
-            match = re.search(pattern, text)
+        for pattern in _CITATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 if len(match.groups()) == 2:  # AIR or SCR
                     return f"{match.group(1)} {match.group(0).split(match.group(1))[1].strip()}"
@@ -619,33 +1074,34 @@ class LegalBriefAnalyzer:
         # If no citation found, return empty string
         return ""
     
-    def _generate_analysis(self, brief_text: str, law_sections: List[Dict[str, Any]], 
-                         case_histories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_analysis(self, brief_text: str, doc: Doc, law_sections: List[Dict[str, Any]], 
+                         case_histories: List[Dict[str, Any]], legal_terms: List[str]) -> Dict[str, Any]:
         """
         Generate legal analysis based on the brief and search results.
         
         Args:
             brief_text: The brief text
+            doc: The parsed brief
             law_sections: Relevant law sections
             case_histories: Relevant case histories
+            legal_terms: Legal terms found in the brief
             
         Returns:
             Dict containing legal analysis
         """
         # Extract key legal issues
-        legal_issues = self._extract_legal_issues(brief_text)
-        
-        # Generate summary
-        summary = self._generate_summary(brief_text, law_sections, case_histories, legal_issues)
+        legal_issues = self._extract_legal_issues(brief_text, doc, legal_terms)
         
-        # Generate arguments
-        arguments = self._generate_arguments(brief_text, law_sections, case_histories, legal_issues)
+        # Format the top section and case labels once for all generators
+        section_labels, case_labels = self._result_labels(law_sections, case_histories)
         
-        # Generate challenges
-        challenges = self._generate_challenges(brief_text, law_sections, case_histories, legal_issues)
+        # Generate summary
+        summary = self._generate_summary(brief_text, section_labels, case_labels, legal_issues, legal_terms)
         
-        # Generate recommendations
-        recommendations = self._generate_recommendations(brief_text, law_sections, case_histories, legal_issues)
+        # Generate arguments, challenges and recommendations
+        arguments, challenges, recommendations = self._generate_all(
+            brief_text, law_sections, case_histories, legal_issues, section_labels, case_labels
+        )
         
         return {
             "summary": summary,
@@ -654,12 +1110,14 @@ class LegalBriefAnalyzer:
             "recommendations": recommendations
         }
     
-    def _extract_legal_issues(self, text: str) -> List[str]:
+    def _extract_legal_issues(self, text: str, doc: Doc, legal_terms: List[str]) -> List[str]:
         """
         Extract key legal issues from the brief.
         
         Args:
             text: The brief text
+            doc: The parsed brief
+            legal_terms: Legal terms found in the brief
             
         Returns:
             List of legal issues
@@ -667,258 +1125,146 @@ class LegalBriefAnalyzer:
         # This is a simplified approach - in a real system, this would be more sophisticated
         legal_issues = []
         
-        # Look for common legal issue indicators
-        issue_indicators = [
-            r'(?i)issue(?:s)?\s+(?:is|are|of)?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)question(?:s)?\s+(?:is|are|of)?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)matter(?:s)?\s+(?:is|are|of)?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)dispute(?:s)?\s+(?:is|are|of)?\s*(.*?)(?=\.\s*[A-Z]|\Z)',
-            r'(?i)contention(?:s)?\s+(?:is|are|of)?\s*(.*?)(?=\.\s*[A-Z]|\Z)'
-        ]
-        
-        for pattern in issue_indicators:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                issue = match.group(1).strip()
-                if len(issue) > 10:  # Ensure it's substantial
-                    legal_issues.append(issue)
+        # Look for common legal issue indicators, in a single pass
+        for issue in _iter_clauses(_ISSUE_RE, text):
+            issue = issue.strip()
+            if len(issue) > 10:  # Ensure it's substantial
+                legal_issues.append(issue)
         
         # If no issues found using indicators, extract key sentences
-        if not legal_issues:
-            doc = nlp(text)
+        if not legal_issues and legal_terms:
             for sent in doc.sents:
+                sent_text = sent.text
+                if len(sent_text) <= 10:
+                    continue
                 # Look for sentences with legal terms
-                if any(term in sent.text.lower() for term in self._extract_legal_terms(text)):
-                    if len(sent.text) > 10:
-                        legal_issues.append(sent.text)
-            
-            # Limit to top 3 issues
-            legal_issues = legal_issues[:3]
+                sent_lower = sent_text.lower()
+                if any(term in sent_lower for term in legal_terms):
+                    legal_issues.append(sent_text)
+                    # Limit to top 3 issues
+                    if len(legal_issues) == 3:
+                        break
         
         return legal_issues
     
-    def _generate_summary(self, brief_text: str, law_sections: List[Dict[str, Any]], 
-                        case_histories: List[Dict[str, Any]], legal_issues: List[str]) -> str:
+    def _generate_summary(self, brief_text: str, section_labels: List[str], case_labels: List[str],
+                        legal_issues: List[str], legal_terms: List[str]) -> str:
         """
         Generate a summary of the legal analysis.
         
         Args:
             brief_text: The brief text
-            law_sections: Relevant law sections
-            case_histories: Relevant case histories
+            section_labels: Labels of the top law sections, most relevant first
+            case_labels: Labels of the top case histories, most relevant first
             legal_issues: Extracted legal issues
+            legal_terms: Legal terms found in the brief
             
         Returns:
             Summary text
         """
-        summary = "This case involves "
+        parts = ["This case involves "]
         
         # Add legal issues
         if legal_issues:
-            summary += legal_issues[0]
+            parts.append(legal_issues[0])
         else:
-            # Extract key legal terms
-            legal_terms = self._extract_legal_terms(brief_text)
+            # Fall back to the key legal terms
             if legal_terms:
-                summary += f"issues related to {', '.join(legal_terms[:3])}"
+                parts.append(f"issues related to {', '.join(legal_terms[:3])}")
             else:
-                summary += "various legal issues as described in the brief"
+                parts.append("various legal issues as described in the brief")
         
         # Add relevant law sections
-        if law_sections:
-            top_sections = sorted(law_sections, key=lambda x: x['relevance'], reverse=True)[:2]
-            section_texts = []
-            for section in top_sections:
-                section_texts.append(f"{section['title']}, Section {section['sectionNumber']}")
-            
-            summary += f". The relevant legal provisions include {' and '.join(section_texts)}"
+        if section_labels:
+            parts.append(f". The relevant legal provisions include {' and '.join(islice(section_labels, 2))}")
         
         # Add relevant case histories
-        if case_histories:
-            top_cases = sorted(case_histories, key=lambda x: x['relevance'], reverse=True)[:2]
-            case_texts = []
-            for case in top_cases:
-                case_texts.append(f"{case['parties']} ({case['citation']})")
-            
-            summary += f". There are precedents from {' and '.join(case_texts)} that may be applicable"
+        if case_labels:
+            parts.append(f". There are precedents from {' and '.join(islice(case_labels, 2))} that may be applicable")
         
-        summary += "."
+        parts.append(".")
         
-        return summary
+        return "".join(parts)
     
-    def _generate_arguments(self, brief_text: str, law_sections: List[Dict[str, Any]], 
-                          case_histories: List[Dict[str, Any]], legal_issues: List[str]) -> List[str]:
+    def _generate_all(self, brief_text: str, law_sections: List[Dict[str, Any]],
+                      case_histories: List[Dict[str, Any]], legal_issues: List[str],
+                      section_labels: List[str], case_labels: List[str]
+                      ) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
         """
-        Generate potential legal arguments.
+        Generate potential arguments, challenges and recommendations in one
+        pass over the top law sections and case histories.
         
         Args:
             brief_text: The brief text
             law_sections: Relevant law sections
             case_histories: Relevant case histories
             legal_issues: Extracted legal issues
+            section_labels: Labels of the top law sections
+            case_labels: Labels of the top case histories
             
         Returns:
-            List of arguments
+            Tuple of the arguments, challenges and recommendations, each
+            as a read-only tuple
         """
         arguments = []
+        challenges = []
+        recommendations = []
         
-        # Generate arguments based on law sections
-        for section in law_sections[:3]:  # Use top 3 sections
-            if section['content']:
-                arg = f"Under {section['title']}, Section {section['sectionNumber']}, "
-                
-                # Extract key phrases from section content
-                doc = nlp(section['content'])
-                key_phrases = []
-                for chunk in doc.noun_chunks:
-                    if len(chunk.text.split()) >= 2 and len(chunk.text.split()) <= 5:
-                        key_phrases.append(chunk.text)
-                
-                if key_phrases:
-                    arg += f"the elements of {key_phrases[0]} are applicable to this case."
-                else:
-                    arg += "the legal provisions are applicable to the facts of this case."
-                
-                arguments.append(arg)
+        # A single word cannot hold a 2-5 word key phrase, so it is not parsed
+        parse = [len(section['content'].split(None, 1)) > 1 for section in law_sections[:3]]
+        
+        # Parse every multi-word section content in one batch
+        contents = [section['content'] for section, parsed in zip(law_sections, parse) if parsed]
+        docs = iter(self.nlp.pipe(contents, batch_size=PIPE_BATCH_SIZE[self.device],
+                                  n_process=self._n_process(len(contents)),
+                                  disable=self.chunk_unused_pipes))
         
-        # Generate arguments based on case histories
-        for case in case_histories[:3]:  # Use top 3 cases
-            if case['holdings']:
-                arg = f"The precedent established in {case['parties']} ({case['citation']}) supports the position that "
+        # Top 3 sections give arguments, top 2 give challenges
+        for rank, (section, label, parsed) in enumerate(zip(law_sections, section_labels, parse)):
+            if section['content']:
+                # Only the first 2-5 word key phrase of the section is used
+                key_phrase = _first_noun_phrase(next(docs)) if parsed else None
                 
-                # Extract key sentence from holdings
-                sentences = nltk.sent_tokenize(case['holdings'])
-                if sentences:
-                    arg += sentences[0]
+                if key_phrase:
+                    tail = f"the elements of {key_phrase} are applicable to this case."
                 else:
-                    arg += "similar legal principles apply to the current case."
+                    tail = "the legal provisions are applicable to the facts of this case."
                 
-                arguments.append(arg)
-        
-        # Ensure we have at least 3 arguments
-        if len(arguments) < 3:
-            # Generate generic arguments based on legal issues
-            generic_arguments = [
-                "The facts presented in the brief clearly establish the elements required for the legal claim.",
-                "The timeline of events demonstrates a clear causal relationship between the actions and the resulting damages.",
-                "The documentary evidence supports the legal position outlined in the brief.",
-                "The opposing party's actions constitute a clear violation of the applicable legal standards.",
-                "The legal precedents consistently support the interpretation of the law as presented in the brief."
-            ]
+                arguments.append(f"Under {label}, {tail}")
             
-            arguments.extend(generic_arguments[:3 - len(arguments)])
-        
-        return arguments[:5]  # Limit to 5 arguments
-    
-    def _generate_challenges(self, brief_text: str, law_sections: List[Dict[str, Any]], 
-                           case_histories: List[Dict[str, Any]], legal_issues: List[str]) -> List[str]:
-        """
-        Generate potential legal challenges.
-        
-        Args:
-            brief_text: The brief text
-            law_sections: Relevant law sections
-            case_histories: Relevant case histories
-            legal_issues: Extracted legal issues
+            if rank < 2:
+                challenges.append(f"The opposing party may argue that {label} "
+                                  "does not apply due to specific factual differences in this case.")
+        
+        if section_labels:
+            recommendations.append(f"Strengthen the legal argument by specifically citing {' and '.join(islice(section_labels, 2))} "
+                                   "and explaining how the facts of the case satisfy the legal requirements.")
+        
+        # Top 3 cases give arguments (up to 5 in total), top 2 give challenges
+        for rank, (case, label) in enumerate(zip(case_histories, case_labels)):
+            if case['holdings'] and len(arguments) < 5:
+                # Only the first sentence of the holdings is used
+                match = _FIRST_SENTENCE_RE.match(case['holdings'])
+                first_sentence = match.group(1) if match else case['holdings'].strip()
+                if not first_sentence:
+                    first_sentence = "similar legal principles apply to the current case."
+                
+                arguments.append(f"The precedent established in {label} supports the position that {first_sentence}")
             
-        Returns:
-            List of challenges
-        """
-        challenges = []
+            if rank < 2:
+                challenges.append(_CASE_CHALLENGE(case))
         
-        # Generate challenges based on law sections
-        for section in law_sections[:2]:  # Use top 2 sections
-            challenge = f"The opposing party may argue that {section['title']}, Section {section['sectionNumber']} "
-            challenge += "does not apply due to specific factual differences in this case."
-            challenges.append(challenge)
+        if case_labels:
+            recommendations.append(f"Cite relevant precedents such as {' and '.join(islice(case_labels, 2))} "
+                                   "to support the legal arguments.")
         
-        # Generate challenges based on case histories
-        for case in case_histories[:2]:  # Use top 2 cases
-            challenge = f"The precedent in {case['parties']} may be distinguished on grounds that "
-            challenge += "the factual circumstances differ significantly from the current case."
-            challenges.append(challenge)
-        
-        # Ensure we have at least 3 challenges
+        # Ensure we have at least 3 arguments and 3 challenges
+        if len(arguments) < 3:
+            arguments.extend(_GENERIC_ARGUMENTS[:3 - len(arguments)])
         if len(challenges) < 3:
-            # Generate generic challenges
-            generic_challenges = [
-                "The evidence presented may be insufficient to establish all elements of the legal claim.",
-                "There may be procedural hurdles that need to be addressed before the substantive issues can be resolved.",
-                "The interpretation of the relevant statutes may be contested by the opposing party.",
-                "The causal connection between the alleged actions and the claimed damages may be difficult to establish.",
-                "The timeline of events may present challenges in establishing the sequence necessary for the legal claim."
-            ]
-            
-            challenges.extend(generic_challenges[:3 - len(challenges)])
-        
-        return challenges[:5]  # Limit to 5 challenges
-    
-    def _generate_recommendations(self, brief_text: str, law_sections: List[Dict[str, Any]], 
-                               case_histories: List[Dict[str, Any]], legal_issues: List[str]) -> List[str]:
-        """
-        Generate legal recommendations.
+            challenges.extend(_GENERIC_CHALLENGES[:3 - len(challenges)])
         
-        Args:
-            brief_text: The brief text
-            law_sections: Relevant law sections
-            case_histories: Relevant case histories
-            legal_issues: Extracted legal issues
-            
-        Returns:
-            List of recommendations
-        """
-        recommendations = []
+        # Fill up with general recommendations, limited to 7 in total
+        recommendations.extend(islice(_GENERAL_RECOMMENDATIONS, 7 - len(recommendations)))
         
-        # Generate specific recommendations based on law sections
-        if law_sections:
-            rec = "Strengthen the legal argument by specifically citing "
-            section_texts = []
-            for section in law_sections[:2]:
-                section_texts.append(f"{section['title']}, Section {section['sectionNumber']}")
-            
-            rec += f"{' and '.join(section_texts)} and explaining how the facts of the case satisfy the legal requirements."
-            recommendations.append(rec)
-        
-        # Generate specific recommendations based on case histories
-        if case_histories:
-            rec = "Cite relevant precedents such as "
-            case_texts = []
-            for case in case_histories[:2]:
-                case_texts.append(f"{case['parties']} ({case['citation']})")
-            
-            rec += f"{' and '.join(case_texts)} to support the legal arguments."
-            recommendations.append(rec)
-        
-        # Add general recommendations
-        general_recommendations = [
-            "Gather and organize all documentary evidence that supports the factual claims made in the brief.",
-            "Consider obtaining expert testimony to strengthen the technical aspects of the case.",
-            "Prepare for potential settlement discussions, as many cases are resolved before trial.",
-            "Develop counter-arguments to address the potential challenges identified above.",
-            "Ensure all procedural requirements are met to avoid unnecessary delays in the legal proceedings."
-        ]
-        
-        recommendations.extend(general_recommendations)
-        
-        return recommendations[:7]  # Limit to 7 recommendations
-
-
-# Example usage
-if __name__ == "__main__":
-    # This is just for testing - in production, the API key should be stored securely
-    api_key = "d053cb3e0082a68b58def9f16e1b43c7a497faf4"
-    analyzer = LegalBriefAnalyzer(api_key)
-    
-    # Example brief
-    brief = """
-    This case involves a breach of contract under Section 73 of the Indian Contract Act. 
-    The defendant failed to deliver goods by the agreed date of 15 March 2023, causing significant 
-    financial losses to my client. The contract clearly specified a delivery date and included 
-    a penalty clause for late delivery. The Supreme Court in Mehta vs. Patel & Others (AIR 2017 SC 567) 
-    established that in cases of contractual breach, the aggrieved party must prove actual damages 
-    suffered to claim compensation under Section 73 of the Indian Contract Act.
-    """
-    
-    # Analyze the brief
-    results = analyzer.analyze_brief(brief)
-    print(json.dumps(results, indent=2))
+        return tuple(arguments), tuple(challenges), tuple(recommendations)
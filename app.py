@@ -27,6 +27,7 @@ SUPABASE_KEY = os.environ.get('SUPABASE_KEY', '')
 
 # Initialize the legal brief analyzer, Supabase client, document generator, and case file drafter
 analyzer = LegalBriefAnalyzer(INDIAN_KANOON_API_KEY)
+analyzer.warmup()
 supabase = SupabaseClient(SUPABASE_URL, SUPABASE_KEY)
 document_generator = DocumentGenerator()
 case_file_drafter = CaseFileDrafter()
@@ -0,0 +1,31 @@
+# Example usage of the legal brief analyzer
+import json
+import os
+import sys
+
+from api.legal_brief_analyzer import LegalBriefAnalyzer
+
+
+def main():
+    api_key = os.environ.get('INDIAN_KANOON_API_KEY')
+    if not api_key:
+        sys.exit("Set INDIAN_KANOON_API_KEY to run the demo")
+    analyzer = LegalBriefAnalyzer(api_key)
+    
+    # Example brief
+    brief = """
+    This case involves a breach of contract under Section 73 of the Indian Contract Act. 
+    The defendant failed to deliver goods by the agreed date of 15 March 2023, causing significant 
+    financial losses to my client. The contract clearly specified a delivery date and included 
+    a penalty clause for late delivery. The Supreme Court in Mehta vs. Patel & Others (AIR 2017 SC 567) 
+    established that in cases of contractual breach, the aggrieved party must prove actual damages 
+    suffered to claim compensation under Section 73 of the Indian Contract Act.
+    """
+    
+    # Analyze the brief
+    results = analyzer.analyze_brief(brief)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Example usage of the legal backend service
+from legal_backend import LegalBackendService
+
+
+def main():
+    # Create the service
+    legal_service = LegalBackendService()
+    
+    # Example brief
+    example_brief = """
+    This case involves a dispute between ABC Corporation and XYZ Ltd regarding a breach of contract. 
+    On January 15, 2024, ABC Corporation entered into an agreement with XYZ Ltd for the supply of 
+    manufacturing equipment worth Rs. 50 lakhs. According to the terms, delivery was to be completed 
+    by March 30, 2024, with a penalty clause for late delivery.
+    
+    XYZ Ltd failed to deliver the equipment by the agreed date and has now refused to honor the penalty 
+    clause, citing force majeure due to supply chain disruptions. However, our investigation reveals that 
+    XYZ Ltd had actually diverted the equipment to another buyer who offered a higher price.
+    
+    We are seeking remedies under Section 73 of the Indian Contract Act, 1872 for breach of contract and 
+    also considering action under Section 420 of the Indian Penal Code for cheating.
+    
+    Previous similar cases include Sharma vs. State of Maharashtra (AIR 2019 SC 1234) where the court 
+    held that diversion of goods to another buyer constitutes cheating.
+    """
+    
+    # Process the brief
+    results = legal_service.process_brief(example_brief)
+    
+    # Print results (in a real application, this would be returned as an API response)
+    print("Brief Analysis:")
+    print(f"Acts: {results['brief_analysis']['acts']}")
+    print(f"Sections: {results['brief_analysis']['sections']}")
+    print(f"Citations: {results['brief_analysis']['citations']}")
+    print(f"Keywords: {results['brief_analysis']['keywords'][:10]}")
+    print(f"Domains: {results['brief_analysis']['domains']}")
+    print("\nLaw Sections:")
+    for section in results['law_sections']:
+        print(f"- {section['title']} Section {section['sectionNumber']} (Relevance: {section['relevance']})")
+    print("\nCase Histories:")
+    for case in results['case_histories']:
+        print(f"- {case['parties']} ({case['citation']}) - Relevance: {case['relevance']}")
+    print("\nAnalysis:")
+    print(f"Summary: {results['analysis']['summary']}")
+    print("Arguments:")
+    for arg in results['analysis']['arguments']:
+        print(f"- {arg}")
+    print("Challenges:")
+    for challenge in results['analysis']['challenges']:
+        print(f"- {challenge}")
+    print("Recommendations:")
+    for rec in results['analysis']['recommendations']:
+        print(f"- {rec}")
+
+
+if __name__ == "__main__":
+    main()
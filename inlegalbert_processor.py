@@ -12,6 +12,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger('inlegalbert_processor')
 
+# Number of texts run through the model per padded batch
+EMBEDDING_BATCH_SIZE = 32
+
 class InLegalBERTProcessor:
     """
     Processor for the InLegalBERT model for enhanced legal text analysis.
@@ -94,6 +97,40 @@ class InLegalBERTProcessor:
             logger.error(f"Error getting document embedding: {str(e)}")
             return None
     
+    def get_document_embeddings(self, texts: List[str], batch_size: int = EMBEDDING_BATCH_SIZE) -> List[Optional[torch.Tensor]]:
+        """
+        Get the [CLS] document embeddings of several texts, running the model
+        on padded batches instead of one text at a time.
+        
+        Args:
+            texts: Input texts
+            batch_size: Number of texts per model call
+            
+        Returns:
+            One embedding per text, None where the model failed on its batch
+        """
+        if not self.model_loaded:
+            logger.warning("Model not loaded, cannot get document embeddings")
+            return [None] * len(texts)
+        
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            try:
+                encoded_input = self.tokenizer(batch, return_tensors="pt", padding=True,
+                                               truncation=True, max_length=512)
+                with torch.no_grad():
+                    output = self.model(**encoded_input)
+                
+                # Keep the [CLS] token of each text, shaped like get_document_embedding
+                cls_embeddings = output.last_hidden_state[:, 0, :]
+                embeddings.extend(cls_embeddings[i:i + 1] for i in range(len(batch)))
+            except Exception as e:
+                logger.error(f"Error getting document embeddings: {str(e)}")
+                embeddings.extend([None] * len(batch))
+        
+        return embeddings
+    
     def segment_document(self, text: str) -> Dict[str, Any]:
         """
         Segment a legal document into functional parts (Facts, Arguments, etc.).
@@ -108,10 +145,22 @@ class InLegalBERTProcessor:
             logger.warning("Model not loaded, cannot segment document")
             return {"error": "Model not loaded"}
         
-        try:
-            # Split the document into sentences
-            sentences = self._split_into_sentences(text)
+        # Split the document into sentences and embed them in batches
+        sentences = self._document_sentences(text)
+        return self._segment_sentences(sentences, self.get_document_embeddings(sentences))
+    
+    def _segment_sentences(self, sentences: List[str], embeddings: List[Optional[torch.Tensor]]) -> Dict[str, Any]:
+        """
+        Classify the sentences of a document into functional parts.
+        
+        Args:
+            sentences: Stripped, non-empty sentences of the document
+            embeddings: The document embedding of each sentence
             
+        Returns:
+            Dictionary with segmented document parts
+        """
+        try:
             # Classify each sentence into a segment
             segments = {
                 "facts": [],
@@ -126,13 +175,7 @@ class InLegalBERTProcessor:
             # This is a simplified implementation
             # In a real implementation, we would use a fine-tuned model for sequence labeling
             # For now, we'll use a simple heuristic approach
-            for sentence in sentences:
-                sentence = sentence.strip()
-                if not sentence:
-                    continue
-                
-                # Get sentence embedding
-                sentence_embedding = self.get_document_embedding(sentence)
+            for sentence, sentence_embedding in zip(sentences, embeddings):
                 if sentence_embedding is None:
                     continue
                 
@@ -220,13 +263,24 @@ class InLegalBERTProcessor:
             logger.warning("Model not loaded, cannot predict judgment")
             return {"error": "Model not loaded"}
         
+        return self._predict_judgment(text, self.get_document_embedding(text))
+    
+    def _predict_judgment(self, text: str, document_embedding: Optional[torch.Tensor]) -> Dict[str, Any]:
+        """
+        Predict the outcome of a case from its text and document embedding.
+        
+        Args:
+            text: Input case facts and arguments
+            document_embedding: The document embedding of the text
+            
+        Returns:
+            Dictionary with prediction results
+        """
         try:
             # This is a simplified implementation
             # In a real implementation, we would use a fine-tuned model for binary classification
             # For now, we'll use a simple heuristic approach
             
-            # Get document embedding
-            document_embedding = self.get_document_embedding(text)
             if document_embedding is None:
                 return {"error": "Failed to get document embedding"}
             
@@ -271,21 +325,71 @@ class InLegalBERTProcessor:
         Returns:
             Enhanced analysis results
         """
+        return self.enhance_brief_analyses([brief], [basic_analysis])[0]
+    
+    def enhance_brief_analyses(self, briefs: List[str], basic_analyses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enhance the basic analyses of several briefs with InLegalBERT insights.
+        
+        The sentences of every brief and the briefs themselves share padded
+        model batches.
+        
+        Args:
+            briefs: Input case briefs
+            basic_analyses: Basic analysis results, one per brief
+            
+        Returns:
+            Enhanced analysis results, in the same order as briefs
+        """
         if not self.model_loaded:
             logger.warning("Model not loaded, cannot enhance brief analysis")
-            return basic_analysis
+            return list(basic_analyses)
+        
+        # Embed all sentences, followed by all whole briefs, in one pass
+        sentences = [self._document_sentences(brief) for brief in briefs]
+        texts = [sentence for brief_sentences in sentences for sentence in brief_sentences]
+        texts.extend(briefs)
+        embeddings = self.get_document_embeddings(texts)
+        document_embeddings = embeddings[len(texts) - len(briefs):]
+        
+        enhanced_analyses = []
+        start = 0
+        for brief, basic_analysis, brief_sentences, document_embedding in zip(
+                briefs, basic_analyses, sentences, document_embeddings):
+            sentence_embeddings = embeddings[start:start + len(brief_sentences)]
+            start += len(brief_sentences)
+            enhanced_analyses.append(self._enhance_brief_analysis(
+                brief, basic_analysis, brief_sentences, sentence_embeddings, document_embedding))
         
+        return enhanced_analyses
+    
+    def _enhance_brief_analysis(self, brief: str, basic_analysis: Dict[str, Any], sentences: List[str],
+                                sentence_embeddings: List[Optional[torch.Tensor]],
+                                document_embedding: Optional[torch.Tensor]) -> Dict[str, Any]:
+        """
+        Enhance the basic analysis of one brief from precomputed embeddings.
+        
+        Args:
+            brief: Input case brief
+            basic_analysis: Basic analysis results
+            sentences: Stripped, non-empty sentences of the brief
+            sentence_embeddings: The document embedding of each sentence
+            document_embedding: The document embedding of the whole brief
+            
+        Returns:
+            Enhanced analysis results
+        """
         try:
             enhanced_analysis = basic_analysis.copy()
             
             # Add document segmentation
-            enhanced_analysis["segments"] = self.segment_document(brief)
+            enhanced_analysis["segments"] = self._segment_sentences(sentences, sentence_embeddings)
             
             # Add statute identification
             enhanced_analysis["identified_statutes"] = self.identify_statutes(brief)
             
             # Add judgment prediction
-            enhanced_analysis["judgment_prediction"] = self.predict_judgment(brief)
+            enhanced_analysis["judgment_prediction"] = self._predict_judgment(brief, document_embedding)
             
             # Add enhanced relevance scores for law sections and case histories
             if "lawSections" in enhanced_analysis:
@@ -305,6 +409,18 @@ class InLegalBERTProcessor:
             logger.error(f"Error enhancing brief analysis: {str(e)}")
             return basic_analysis
     
+    def _document_sentences(self, text: str) -> List[str]:
+        """
+        Split a text into stripped, non-empty sentences.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            List of sentences
+        """
+        return [sentence for sentence in map(str.strip, self._split_into_sentences(text)) if sentence]
+    
     def _split_into_sentences(self, text: str) -> List[str]:
         """
         Split a text into sentences.
@@ -1,14 +1,33 @@
 import os
+import copy
 import json
 import re
-from typing import Dict, List, Any, Optional, Tuple
+import sys
+import time
+import sqlite3
+import threading
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from heapq import nlargest
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterator, List, Any, Optional, Set, Tuple, TypedDict, cast
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
-import spacy
 import requests
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -20,32 +39,147 @@ except LookupError:
     nltk.download('punkt')
     nltk.download('stopwords')
 
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    os.system("python -m spacy download en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
+# spaCy components the analyzer never reads; only named entities are used
+_NLP_DISABLED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+
+@lru_cache(maxsize=None)
+def _load_nlp() -> "Language":
+    """
+    Load the spaCy pipeline on first use, so importing this module stays cheap.
+    
+    The pipeline is shared by every LegalBriefAnalyzer in the process.
+    """
+    import spacy
+    
+    try:
+        return spacy.load("en_core_web_sm", disable=_NLP_DISABLED_PIPES)
+    except OSError:
+        os.system("python -m spacy download en_core_web_sm")
+        return spacy.load("en_core_web_sm", disable=_NLP_DISABLED_PIPES)
+
+class BriefAnalysis(TypedDict):
+    """Information extracted from a legal brief by LegalBriefAnalyzer."""
+    acts: List[str]
+    sections: List[str]
+    citations: List[str]
+    legal_entities: List[Dict[str, str]]
+    keywords: List[str]
+    domains: List[str]
+    summary: str
+
+
+class LawSection(TypedDict):
+    """A law section returned by the legal database connectors."""
+    title: str
+    sectionNumber: str
+    content: str
+    relevance: int
+
+
+class CaseHistory(TypedDict):
+    """A case history returned by the legal database connectors."""
+    citation: str
+    parties: str
+    holdings: str
+    relevance: int
+    date: str
+
+
+class Analysis(TypedDict):
+    """Analysis generated by LegalAnalysisGenerator."""
+    summary: str
+    arguments: List[str]
+    challenges: List[str]
+    recommendations: List[str]
+
+
+class BriefResult(TypedDict):
+    """Full result of LegalBackendService.process_brief."""
+    brief_analysis: BriefAnalysis
+    law_sections: List[LawSection]
+    case_histories: List[CaseHistory]
+    analysis: Analysis
+
+
+# Text normalization patterns
+_WHITESPACE_RE = re.compile(r'\s+')
+_DOUBLE_QUOTE_RE = re.compile('[\u201c\u201d\u201e]')
+_SINGLE_QUOTE_RE = re.compile('[\u2018\u2019\u201a]')
+
+# Legal entity patterns
+_LEGAL_ACT_RE = re.compile(r'([A-Z][a-z]+(?: [A-Z][a-z]+)* Act,? (?:of )?\d{4})')
+_SECTION_RE = re.compile(r'[Ss]ection (\d+[A-Za-z]*)(?:\([a-z0-9]+\))?')
+_CASE_CITATION_RE = re.compile(r'(\(\d{4}\) \d+ SCC \d+|AIR \d{4} SC \d+)')
+
+# Sort key for ranking search results
+_BY_RELEVANCE = itemgetter("relevance")
+
+# Shared pool for blocking connector calls
+_CONNECTOR_POOL_SIZE = 8
+_CONNECTOR_POOL = ThreadPoolExecutor(max_workers=_CONNECTOR_POOL_SIZE, thread_name_prefix="legal-connector")
+
+# How long persisted connector responses stay valid
+CONNECTOR_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Maximum number of briefs accepted by LegalBackendService.process_briefs
+MAX_BATCH_BRIEFS = 64
+
+# Cache settings for repeated brief submissions
+ANALYSIS_CACHE_SIZE = 512
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL = 300  # seconds
+
+
+def serialize_results(results: BriefResult) -> bytes:
+    """
+    Serialize a process_brief result to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(results)
+    return json.dumps(results, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _brief_cache_key(brief_text: str) -> bytes:
+    """Content hash of a brief, ignoring whitespace-only differences."""
+    normalized = " ".join(brief_text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def _dedupe_terms(terms: List[str], lowercase: bool = False) -> List[str]:
+    """Remove repeated search terms, preserving order and interning the survivors."""
+    if lowercase:
+        terms = [term.lower() for term in terms]
+    return [sys.intern(term) for term in dict.fromkeys(terms)]
+
+
+def _freeze_params(query_params: Dict[str, Any]) -> Tuple:
+    """Hashable form of search parameters, used as a cache key."""
+    return tuple((key, tuple(value)) for key, value in sorted(query_params.items()))
+
 
 class LegalBriefAnalyzer:
     """
     Analyzes legal briefs to extract key information and prepare for database queries.
     """
     
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self) -> None:
+        self.stop_words: Set[str] = set(stopwords.words('english'))
         # Add legal stopwords
-        self.legal_stop_words = {
+        self.legal_stop_words: Set[str] = {
             'plaintiff', 'defendant', 'petitioner', 'respondent', 'appellant', 'versus', 'vs',
             'court', 'judge', 'justice', 'honorable', 'case', 'matter', 'petition', 'appeal'
         }
         self.stop_words.update(self.legal_stop_words)
-        
-        # Legal entity patterns
-        self.legal_act_pattern = re.compile(r'([A-Z][a-z]+(?: [A-Z][a-z]+)* Act,? (?:of )?\d{4})')
-        self.section_pattern = re.compile(r'[Ss]ection (\d+[A-Za-z]*)(?:\([a-z0-9]+\))?')
-        self.case_citation_pattern = re.compile(r'(\(\d{4}\) \d+ SCC \d+|AIR \d{4} SC \d+)')
     
-    def analyze_brief(self, brief_text: str) -> Dict[str, Any]:
+    @cached_property
+    def nlp(self) -> "Language":
+        """spaCy pipeline, loaded the first time entity extraction needs it."""
+        return _load_nlp()
+    
+    def analyze_brief(self, brief_text: str) -> BriefAnalysis:
         """
         Analyze the legal brief and extract key information.
         
@@ -57,12 +191,30 @@ class LegalBriefAnalyzer:
         """
         # Preprocess text
         clean_text = self._preprocess_text(brief_text)
+        return self._analyze_clean_text(clean_text, self.nlp(clean_text))
+    
+    def analyze_briefs(self, brief_texts: List[str], batch_size: int = 32) -> List[BriefAnalysis]:
+        """
+        Analyze several legal briefs, running them through spaCy as one batch.
         
+        Args:
+            brief_texts: The texts of the legal briefs
+            batch_size: Number of briefs spaCy processes per batch
+            
+        Returns:
+            One analysis dictionary per brief, in input order
+        """
+        clean_texts = [self._preprocess_text(brief_text) for brief_text in brief_texts]
+        docs = self.nlp.pipe(clean_texts, batch_size=batch_size)
+        return [self._analyze_clean_text(clean_text, doc) for clean_text, doc in zip(clean_texts, docs)]
+    
+    def _analyze_clean_text(self, clean_text: str, doc: "Doc") -> BriefAnalysis:
+        """Extract key information from preprocessed text and its spaCy Doc."""
         # Extract key information
         acts = self._extract_acts(clean_text)
         sections = self._extract_sections(clean_text)
         citations = self._extract_citations(clean_text)
-        legal_entities = self._extract_legal_entities(clean_text)
+        legal_entities = self._extract_legal_entities(doc)
         keywords = self._extract_keywords(clean_text)
         
         # Identify legal domains
@@ -81,32 +233,31 @@ class LegalBriefAnalyzer:
     def _preprocess_text(self, text: str) -> str:
         """Clean and normalize the text."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         # Normalize quotes
-        text = re.sub(r'["""]', '"', text)
+        text = _DOUBLE_QUOTE_RE.sub('"', text)
         # Normalize apostrophes
-        text = re.sub(r'[''']', "'", text)
+        text = _SINGLE_QUOTE_RE.sub("'", text)
         return text
     
     def _extract_acts(self, text: str) -> List[str]:
         """Extract mentions of legal acts."""
-        acts = self.legal_act_pattern.findall(text)
+        acts = _LEGAL_ACT_RE.findall(text)
         # Remove duplicates while preserving order
         return list(dict.fromkeys(acts))
     
     def _extract_sections(self, text: str) -> List[str]:
         """Extract section numbers mentioned in the text."""
-        sections = self.section_pattern.findall(text)
+        sections = _SECTION_RE.findall(text)
         return list(dict.fromkeys(sections))
     
     def _extract_citations(self, text: str) -> List[str]:
         """Extract case citations from the text."""
-        citations = self.case_citation_pattern.findall(text)
+        citations = _CASE_CITATION_RE.findall(text)
         return list(dict.fromkeys(citations))
     
-    def _extract_legal_entities(self, text: str) -> List[Dict[str, str]]:
-        """Extract named entities related to legal cases."""
-        doc = nlp(text)
+    def _extract_legal_entities(self, doc: "Doc") -> List[Dict[str, str]]:
+        """Extract named entities related to legal cases from a spaCy Doc."""
         entities = []
         
         for ent in doc.ents:
@@ -207,13 +358,147 @@ class LegalBriefAnalyzer:
         return summary
 
 
+def _score_law_section(title_lower: str, content_lower: str,
+                       acts_lower: List[str], keywords_lower: List[str]) -> int:
+    """
+    Score a law section against lowercased search terms.
+    
+    Returns:
+        Relevance between 0 and 10
+    """
+    relevance = 0
+    
+    # Check if section matches any specified acts
+    if any(act in title_lower for act in acts_lower):
+        relevance += 5
+    
+    # Check for keyword matches in content
+    relevance += sum(1 for keyword in keywords_lower if keyword in content_lower)
+    
+    return min(10, relevance)
+
+
+def _score_case_history(holdings: str, holdings_lower: str,
+                        section_refs: List[str], keywords_lower: List[str]) -> int:
+    """
+    Score a case history against section references and lowercased keywords.
+    
+    Returns:
+        Relevance between 0 and 10
+    """
+    # Check if case mentions any specified sections
+    relevance = 5 * sum(1 for ref in section_refs if ref in holdings)
+    
+    # Check for keyword matches in holdings
+    relevance += sum(1 for keyword in keywords_lower if keyword in holdings_lower)
+    
+    return min(10, relevance)
+
+
+@lru_cache(maxsize=None)
+def _mock_law_section_index() -> Tuple[Tuple[Dict[str, Any], str, str], ...]:
+    """
+    Load the mock law sections once per process.
+    
+    Returns:
+        Tuples of (section, lowercased title, lowercased content)
+    """
+    # Load mock data from file
+    try:
+        with open("mock_law_sections.json", "r") as f:
+            all_sections = json.load(f)
+    except FileNotFoundError:
+        # Create some basic mock data if file doesn't exist
+        all_sections = [
+            {
+                "title": "Indian Penal Code",
+                "sectionNumber": "420",
+                "content": "Whoever cheats and thereby dishonestly induces the person deceived to deliver any property to any person, or to make, alter or destroy the whole or any part of a valuable security, or anything which is signed or sealed, and which is capable of being converted into a valuable security, shall be punished with imprisonment of either description for a term which may extend to seven years, and shall also be liable to fine.",
+                "relevance": 9
+            },
+            {
+                "title": "Indian Contract Act",
+                "sectionNumber": "73",
+                "content": "When a contract has been broken, the party who suffers by such breach is entitled to receive, from the party who has broken the contract, compensation for any loss or damage caused to him thereby, which naturally arose in the usual course of things from such breach, or which the parties knew, when they made the contract, to be likely to result from the breach of it.",
+                "relevance": 7
+            }
+        ]
+    
+    return tuple((section, section["title"].lower(), section["content"].lower())
+                 for section in all_sections)
+
+
+@lru_cache(maxsize=None)
+def _mock_case_history_index() -> Tuple[Tuple[Dict[str, Any], str], ...]:
+    """
+    Load the mock case histories once per process.
+    
+    Returns:
+        Tuples of (case, lowercased holdings)
+    """
+    # Load mock data from file
+    try:
+        with open("mock_case_histories.json", "r") as f:
+            all_cases = json.load(f)
+    except FileNotFoundError:
+        # Create some basic mock data if file doesn't exist
+        all_cases = [
+            {
+                "citation": "AIR 2019 SC 1234",
+                "parties": "Sharma vs. State of Maharashtra",
+                "holdings": "The Supreme Court held that for an offense under Section 420 of IPC, the intention to deceive should be present from the beginning of the transaction.",
+                "relevance": 8,
+                "date": "12 Mar 2019"
+            },
+            {
+                "citation": "AIR 2017 SC 567",
+                "parties": "Mehta vs. Patel & Others",
+                "holdings": "The Court established that in cases of contractual breach, the aggrieved party must prove actual damages suffered to claim compensation under Section 73 of the Indian Contract Act.",
+                "relevance": 6,
+                "date": "05 Aug 2017"
+            }
+        ]
+    
+    return tuple((case, case["holdings"].lower()) for case in all_cases)
+
+
+@lru_cache(maxsize=None)
+def _mock_law_content_blob() -> str:
+    """All lowercased mock section contents joined into one searchable string."""
+    return "\0".join(content_lower for _, _, content_lower in _mock_law_section_index())
+
+
+@lru_cache(maxsize=None)
+def _mock_holdings_blobs() -> Tuple[str, str]:
+    """All mock case holdings joined into one string, as written and lowercased."""
+    index = _mock_case_history_index()
+    return ("\0".join(case["holdings"] for case, _ in index),
+            "\0".join(holdings_lower for _, holdings_lower in index))
+
+
+@lru_cache(maxsize=None)
+def _get_http_session() -> requests.Session:
+    """
+    HTTP session shared by every connector in the process.
+    
+    Reuses pooled keep-alive connections across requests; the pool is sized
+    to match the connector thread pool.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=_CONNECTOR_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class LegalDatabaseConnector:
     """
     Base class for connecting to legal databases and retrieving information.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key
+    def __init__(self, api_key: Optional[str] = None) -> None:
+        self.api_key: Optional[str] = api_key
+        self.session: requests.Session = _get_http_session()
     
     def search_law_sections(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -245,9 +530,9 @@ class ManupatraConnector(LegalDatabaseConnector):
     Connector for Manupatra legal database.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str) -> None:
         super().__init__(api_key)
-        self.base_url = "https://api.manupatrafast.com/v1"  # Example URL, would need to be updated
+        self.base_url: str = "https://api.manupatrafast.com/v1"  # Example URL, would need to be updated
     
     def search_law_sections(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -265,7 +550,7 @@ class ManupatraConnector(LegalDatabaseConnector):
         # Example implementation with actual API:
         # endpoint = f"{self.base_url}/laws/search"
         # headers = {"Authorization": f"Bearer {self.api_key}"}
-        # response = requests.get(endpoint, headers=headers, params=query_params)
+        # response = self.session.get(endpoint, headers=headers, params=query_params)
         # if response.status_code == 200:
         #     return response.json()["results"]
         # else:
@@ -290,7 +575,7 @@ class ManupatraConnector(LegalDatabaseConnector):
         # Example implementation with actual API:
         # endpoint = f"{self.base_url}/cases/search"
         # headers = {"Authorization": f"Bearer {self.api_key}"}
-        # response = requests.get(endpoint, headers=headers, params=query_params)
+        # response = self.session.get(endpoint, headers=headers, params=query_params)
         # if response.status_code == 200:
         #     return response.json()["results"]
         # else:
@@ -301,110 +586,53 @@ class ManupatraConnector(LegalDatabaseConnector):
     
     def _simulate_law_section_results(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Simulate law section search results for development purposes."""
-        # Load mock data from file
-        try:
-            with open("mock_law_sections.json", "r") as f:
-                all_sections = json.load(f)
-        except FileNotFoundError:
-            # Create some basic mock data if file doesn't exist
-            all_sections = [
-                {
-                    "title": "Indian Penal Code",
-                    "sectionNumber": "420",
-                    "content": "Whoever cheats and thereby dishonestly induces the person deceived to deliver any property to any person, or to make, alter or destroy the whole or any part of a valuable security, or anything which is signed or sealed, and which is capable of being converted into a valuable security, shall be punished with imprisonment of either description for a term which may extend to seven years, and shall also be liable to fine.",
-                    "relevance": 9
-                },
-                {
-                    "title": "Indian Contract Act",
-                    "sectionNumber": "73",
-                    "content": "When a contract has been broken, the party who suffers by such breach is entitled to receive, from the party who has broken the contract, compensation for any loss or damage caused to him thereby, which naturally arose in the usual course of things from such breach, or which the parties knew, when they made the contract, to be likely to result from the breach of it.",
-                    "relevance": 7
-                }
-            ]
-        
         # Filter based on query parameters
         results = []
-        keywords = query_params.get("keywords", [])
-        acts = query_params.get("acts", [])
+        acts = [act.lower() for act in query_params.get("acts", [])]
         
-        for section in all_sections:
-            # Simple relevance scoring
-            relevance = 0
-            
-            # Check if section matches any specified acts
-            if acts and any(act.lower() in section["title"].lower() for act in acts):
-                relevance += 5
-            
-            # Check for keyword matches in content
-            for keyword in keywords:
-                if keyword.lower() in section["content"].lower():
-                    relevance += 1
+        # Drop keywords that appear nowhere in the corpus before scoring each section
+        content_blob = _mock_law_content_blob()
+        keywords = [keyword for keyword in (k.lower() for k in query_params.get("keywords", []))
+                    if keyword in content_blob]
+        if not keywords and not acts:
+            return []
+        
+        for section, title_lower, content_lower in _mock_law_section_index():
+            relevance = _score_law_section(title_lower, content_lower, acts, keywords)
             
             # Include if relevant
             if relevance > 0:
                 section_copy = section.copy()
-                section_copy["relevance"] = min(10, relevance)
+                section_copy["relevance"] = relevance
                 results.append(section_copy)
         
-        # Sort by relevance
-        results.sort(key=lambda x: x["relevance"], reverse=True)
-        
-        return results[:5]  # Return top 5 results
+        # Return top 5 results by relevance
+        return nlargest(5, results, key=_BY_RELEVANCE)
     
     def _simulate_case_history_results(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Simulate case history search results for development purposes."""
-        # Load mock data from file
-        try:
-            with open("mock_case_histories.json", "r") as f:
-                all_cases = json.load(f)
-        except FileNotFoundError:
-            # Create some basic mock data if file doesn't exist
-            all_cases = [
-                {
-                    "citation": "AIR 2019 SC 1234",
-                    "parties": "Sharma vs. State of Maharashtra",
-                    "holdings": "The Supreme Court held that for an offense under Section 420 of IPC, the intention to deceive should be present from the beginning of the transaction.",
-                    "relevance": 8,
-                    "date": "12 Mar 2019"
-                },
-                {
-                    "citation": "AIR 2017 SC 567",
-                    "parties": "Mehta vs. Patel & Others",
-                    "holdings": "The Court established that in cases of contractual breach, the aggrieved party must prove actual damages suffered to claim compensation under Section 73 of the Indian Contract Act.",
-                    "relevance": 6,
-                    "date": "05 Aug 2017"
-                }
-            ]
-        
         # Filter based on query parameters
         results = []
-        keywords = query_params.get("keywords", [])
-        sections = query_params.get("sections", [])
-        
-        for case in all_cases:
-            # Simple relevance scoring
-            relevance = 0
-            
-            # Check if case mentions any specified sections
-            for section in sections:
-                if f"Section {section}" in case["holdings"]:
-                    relevance += 5
-            
-            # Check for keyword matches in holdings
-            for keyword in keywords:
-                if keyword.lower() in case["holdings"].lower():
-                    relevance += 1
+        # Drop terms that appear nowhere in the corpus before scoring each case
+        holdings_blob, holdings_blob_lower = _mock_holdings_blobs()
+        keywords = [keyword for keyword in (k.lower() for k in query_params.get("keywords", []))
+                    if keyword in holdings_blob_lower]
+        section_refs = [ref for ref in (f"Section {section}" for section in query_params.get("sections", []))
+                        if ref in holdings_blob]
+        if not keywords and not section_refs:
+            return []
+        
+        for case, holdings_lower in _mock_case_history_index():
+            relevance = _score_case_history(case["holdings"], holdings_lower, section_refs, keywords)
             
             # Include if relevant
             if relevance > 0:
                 case_copy = case.copy()
-                case_copy["relevance"] = min(10, relevance)
+                case_copy["relevance"] = relevance
                 results.append(case_copy)
         
-        # Sort by relevance
-        results.sort(key=lambda x: x["relevance"], reverse=True)
-        
-        return results[:5]  # Return top 5 results
+        # Return top 5 results by relevance
+        return nlargest(5, results, key=_BY_RELEVANCE)
 
 
 class IndianKanoonConnector(LegalDatabaseConnector):
@@ -412,9 +640,9 @@ class IndianKanoonConnector(LegalDatabaseConnector):
     Connector for Indian Kanoon legal database.
     """
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str) -> None:
         super().__init__(api_key)
-        self.base_url = "https://api.indiankanoon.org/v1"  # Example URL, would need to be updated
+        self.base_url: str = "https://api.indiankanoon.org/v1"  # Example URL, would need to be updated
     
     def search_law_sections(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -459,15 +687,105 @@ class IndianKanoonConnector(LegalDatabaseConnector):
         return connector._simulate_case_history_results(query_params)
 
 
+class ConnectorResponseCache:
+    """
+    Persistent SQLite cache for connector search responses.
+    
+    Writes are buffered in memory and flushed in a single transaction at the
+    end of a request, instead of one write per cache miss.
+    """
+    
+    def __init__(self, path: str, ttl: int = CONNECTOR_CACHE_TTL) -> None:
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: Path of the SQLite database file
+            ttl: Maximum age in seconds of a usable cache entry
+        """
+        self.ttl: int = ttl
+        self._lock = threading.Lock()
+        self._pending: Dict[bytes, Tuple[str, int]] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)")
+    
+    @staticmethod
+    def make_key(*parts: Any) -> bytes:
+        """Build a cache key from JSON-serializable parts."""
+        payload = json.dumps(parts, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            row = self._pending.get(key)
+            if row is None:
+                row = self._conn.execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+    
+    def put(self, key: bytes, value: Any) -> None:
+        """Buffer a value to be written on the next flush."""
+        with self._lock:
+            self._pending[key] = (json.dumps(value), int(time.time()))
+    
+    def flush(self) -> None:
+        """Write all buffered values and drop expired rows in one transaction."""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [(key, value, ts) for key, (value, ts) in self._pending.items()]
+            self._pending.clear()
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO cache (key, value, ts) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, ts = excluded.ts",
+                    rows)
+                self._conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - self.ttl,))
+
+
+class CachingConnector(LegalDatabaseConnector):
+    """
+    Wraps a connector and serves repeated searches from a ConnectorResponseCache.
+    """
+    
+    def __init__(self, connector: LegalDatabaseConnector, cache: ConnectorResponseCache) -> None:
+        super().__init__(connector.api_key)
+        self.connector = connector
+        self.cache = cache
+    
+    def search_law_sections(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Search law sections through the wrapped connector, using cached results when available."""
+        return self._search_cached("search_law_sections", query_params)
+    
+    def search_case_history(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Search case histories through the wrapped connector, using cached results when available."""
+        return self._search_cached("search_case_history", query_params)
+    
+    def _search_cached(self, method_name: str, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        key = self.cache.make_key(self.connector.__class__.__name__, method_name, query_params)
+        results = self.cache.get(key)
+        if results is None:
+            results = getattr(self.connector, method_name)(query_params)
+            self.cache.put(key, results)
+        return results
+
+
 class LegalDataAggregator:
     """
     Aggregates results from multiple legal database connectors.
+    
+    Connector calls are blocking, so they are fanned out over a shared
+    thread pool and run concurrently.
     """
     
-    def __init__(self, connectors: List[LegalDatabaseConnector]):
-        self.connectors = connectors
+    def __init__(self, connectors: List[LegalDatabaseConnector]) -> None:
+        self.connectors: List[LegalDatabaseConnector] = connectors
     
-    def search_law_sections(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def search_law_sections(self, query_params: Dict[str, Any]) -> List[LawSection]:
         """
         Search for relevant law sections across all connected databases.
         
@@ -477,29 +795,10 @@ class LegalDataAggregator:
         Returns:
             Aggregated and deduplicated list of law sections
         """
-        all_results = []
-        
-        # Query each connector
-        for connector in self.connectors:
-            try:
-                results = connector.search_law_sections(query_params)
-                all_results.extend(results)
-            except Exception as e:
-                print(f"Error querying connector {connector.__class__.__name__}: {e}")
-        
-        # Deduplicate results based on title and section number
-        deduplicated = {}
-        for result in all_results:
-            key = (result["title"], result["sectionNumber"])
-            if key not in deduplicated or result["relevance"] > deduplicated[key]["relevance"]:
-                deduplicated[key] = result
-        
-        # Sort by relevance
-        sorted_results = sorted(deduplicated.values(), key=lambda x: x["relevance"], reverse=True)
-        
-        return sorted_results
+        futures = self._submit("search_law_sections", query_params)
+        return self._merge_law_sections(self._collect(futures))
     
-    def search_case_history(self, query_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def search_case_history(self, query_params: Dict[str, Any]) -> List[CaseHistory]:
         """
         Search for relevant case histories across all connected databases.
         
@@ -509,27 +808,82 @@ class LegalDataAggregator:
         Returns:
             Aggregated and deduplicated list of case histories
         """
-        all_results = []
+        futures = self._submit("search_case_history", query_params)
+        return self._merge_case_histories(self._collect(futures))
+    
+    def search_all(self, query_params: Dict[str, Any]) -> Tuple[List[LawSection], List[CaseHistory]]:
+        """
+        Search law sections and case histories across all connected databases at once.
         
-        # Query each connector
-        for connector in self.connectors:
+        Args:
+            query_params: Parameters for the search
+            
+        Returns:
+            Tuple of (law sections, case histories), each aggregated and deduplicated
+        """
+        law_futures = self._submit("search_law_sections", query_params)
+        case_futures = self._submit("search_case_history", query_params)
+        return (self._merge_law_sections(self._collect(law_futures)),
+                self._merge_case_histories(self._collect(case_futures)))
+    
+    def _submit(self, method_name: str, query_params: Dict[str, Any]) -> List[Tuple[LegalDatabaseConnector, Future]]:
+        """Start the named search method on every connector in the shared pool."""
+        return [(connector, _CONNECTOR_POOL.submit(getattr(connector, method_name), query_params))
+                for connector in self.connectors]
+    
+    def _collect(self, futures: List[Tuple[LegalDatabaseConnector, Future]]) -> List[Dict[str, Any]]:
+        """Gather connector results in connector order, skipping connectors that failed."""
+        all_results = []
+        for connector, future in futures:
             try:
-                results = connector.search_case_history(query_params)
-                all_results.extend(results)
+                all_results.extend(future.result())
             except Exception as e:
                 print(f"Error querying connector {connector.__class__.__name__}: {e}")
+        return all_results
+    
+    def _merge_law_sections(self, all_results: List[Dict[str, Any]]) -> List[LawSection]:
+        """Deduplicate law sections on title and section number, then sort by relevance."""
+        deduplicated = {}
+        for result in all_results:
+            key = (result["title"], result["sectionNumber"])
+            if key not in deduplicated or result["relevance"] > deduplicated[key]["relevance"]:
+                deduplicated[key] = result
         
-        # Deduplicate results based on citation
+        return sorted(deduplicated.values(), key=_BY_RELEVANCE, reverse=True)
+    
+    def _merge_case_histories(self, all_results: List[Dict[str, Any]]) -> List[CaseHistory]:
+        """Deduplicate case histories on citation, then sort by relevance."""
         deduplicated = {}
         for result in all_results:
             key = result["citation"]
             if key not in deduplicated or result["relevance"] > deduplicated[key]["relevance"]:
                 deduplicated[key] = result
         
-        # Sort by relevance
-        sorted_results = sorted(deduplicated.values(), key=lambda x: x["relevance"], reverse=True)
-        
-        return sorted_results
+        return sorted(deduplicated.values(), key=_BY_RELEVANCE, reverse=True)
+
+
+# Fallback text used when the search results give too little to work with
+_GENERIC_ARGUMENTS = (
+    "The facts presented establish a prima facie case that meets all statutory requirements.",
+    "The opposing party's actions constitute a clear violation of established legal principles.",
+    "Procedural irregularities in the opposing party's approach undermine their position."
+)
+
+_GENERIC_CHALLENGES = (
+    "Establishing sufficient evidence to meet the burden of proof may be challenging.",
+    "The opposing party may argue that the statute of limitations has expired.",
+    "Jurisdictional issues could arise if the matter crosses state boundaries.",
+    "Proving the requisite intent element may be difficult without direct evidence.",
+    "Quantifying damages precisely could be challenging without expert testimony."
+)
+
+_GENERIC_RECOMMENDATIONS = (
+    "Gather all documentary evidence to support factual assertions in the case.",
+    "Consider engaging expert witnesses to strengthen technical aspects of the case.",
+    "Prepare detailed affidavits from all relevant witnesses.",
+    "Explore alternative dispute resolution options before proceeding to trial.",
+    "Conduct thorough research on the presiding judge's previous rulings in similar cases."
+)
 
 
 class LegalAnalysisGenerator:
@@ -537,9 +891,9 @@ class LegalAnalysisGenerator:
     Generates legal analysis based on brief and search results.
     """
     
-    def generate_analysis(self, brief_analysis: Dict[str, Any], 
-                         law_sections: List[Dict[str, Any]], 
-                         case_histories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_analysis(self, brief_analysis: BriefAnalysis, 
+                         law_sections: List[LawSection], 
+                         case_histories: List[CaseHistory]) -> Analysis:
         """
         Generate legal analysis based on the brief and search results.
         
@@ -573,14 +927,14 @@ class LegalAnalysisGenerator:
             "recommendations": recommendations
         }
     
-    def _generate_summary(self, brief_analysis: Dict[str, Any], 
-                         law_sections: List[Dict[str, Any]], 
-                         case_histories: List[Dict[str, Any]]) -> str:
+    def _generate_summary(self, brief_analysis: BriefAnalysis, 
+                         law_sections: List[LawSection], 
+                         case_histories: List[CaseHistory]) -> str:
         """Generate a summary of the legal analysis."""
         domains = brief_analysis.get("domains", ["general"])
         acts = brief_analysis.get("acts", [])
         
-        summary_parts = []
+        summary_parts: List[str] = []
         
         # Add domain information
         if domains and domains[0] != "general":
@@ -621,11 +975,11 @@ class LegalAnalysisGenerator:
         
         return summary
     
-    def _generate_arguments(self, brief_analysis: Dict[str, Any], 
-                           law_sections: List[Dict[str, Any]], 
-                           case_histories: List[Dict[str, Any]]) -> List[str]:
+    def _generate_arguments(self, brief_analysis: BriefAnalysis, 
+                           law_sections: List[LawSection], 
+                           case_histories: List[CaseHistory]) -> List[str]:
         """Generate potential legal arguments."""
-        arguments = []
+        arguments: List[str] = []
         
         # Arguments based on law sections
         for section in law_sections[:3]:
@@ -644,29 +998,15 @@ class LegalAnalysisGenerator:
         
         # Add generic arguments if needed
         if len(arguments) < 3:
-            generic_arguments = [
-                "The facts presented establish a prima facie case that meets all statutory requirements.",
-                "The opposing party's actions constitute a clear violation of established legal principles.",
-                "Procedural irregularities in the opposing party's approach undermine their position."
-            ]
-            arguments.extend(generic_arguments[:3 - len(arguments)])
-        
-        return arguments[:5]  # Return up to 5 arguments
-    
-    def _generate_challenges(self, brief_analysis: Dict[str, Any], 
-                            law_sections: List[Dict[str, Any]], 
-                            case_histories: List[Dict[str, Any]]) -> List[str]:
+            arguments.extend(_GENERIC_ARGUMENTS[:3 - len(arguments)])
+        
+        return arguments  # At most 3 section + 2 case arguments
+    
+    def _generate_challenges(self, brief_analysis: BriefAnalysis, 
+                            law_sections: List[LawSection], 
+                            case_histories: List[CaseHistory]) -> List[str]:
         """Generate potential legal challenges."""
-        challenges = []
-        
-        # Add generic challenges
-        generic_challenges = [
-            "Establishing sufficient evidence to meet the burden of proof may be challenging.",
-            "The opposing party may argue that the statute of limitations has expired.",
-            "Jurisdictional issues could arise if the matter crosses state boundaries.",
-            "Proving the requisite intent element may be difficult without direct evidence.",
-            "Quantifying damages precisely could be challenging without expert testimony."
-        ]
+        challenges: List[str] = []
         
         # Add specific challenges based on domains
         domains = brief_analysis.get("domains", ["general"])
@@ -682,24 +1022,15 @@ class LegalAnalysisGenerator:
         
         # Ensure we have enough challenges
         if len(challenges) < 3:
-            challenges.extend(generic_challenges[:3 - len(challenges)])
+            challenges.extend(_GENERIC_CHALLENGES[:3 - len(challenges)])
         
-        return challenges[:4]  # Return up to 4 challenges
+        return challenges  # At most 3 domain-specific challenges
     
-    def _generate_recommendations(self, brief_analysis: Dict[str, Any], 
-                                 law_sections: List[Dict[str, Any]], 
-                                 case_histories: List[Dict[str, Any]]) -> List[str]:
+    def _generate_recommendations(self, brief_analysis: BriefAnalysis, 
+                                 law_sections: List[LawSection], 
+                                 case_histories: List[CaseHistory]) -> List[str]:
         """Generate strategic recommendations."""
-        recommendations = []
-        
-        # Add generic recommendations
-        generic_recommendations = [
-            "Gather all documentary evidence to support factual assertions in the case.",
-            "Consider engaging expert witnesses to strengthen technical aspects of the case.",
-            "Prepare detailed affidavits from all relevant witnesses.",
-            "Explore alternative dispute resolution options before proceeding to trial.",
-            "Conduct thorough research on the presiding judge's previous rulings in similar cases."
-        ]
+        recommendations: List[str] = []
         
         # Add specific recommendations based on domains
         domains = brief_analysis.get("domains", ["general"])
@@ -720,9 +1051,9 @@ class LegalAnalysisGenerator:
         
         # Ensure we have enough recommendations
         if len(recommendations) < 4:
-            recommendations.extend(generic_recommendations[:4 - len(recommendations)])
+            recommendations.extend(_GENERIC_RECOMMENDATIONS[:4 - len(recommendations)])
         
-        return recommendations[:5]  # Return up to 5 recommendations
+        return recommendations  # At most 3 domain-specific + 1 case recommendation
 
 
 class LegalBackendService:
@@ -730,16 +1061,16 @@ class LegalBackendService:
     Main service class that coordinates the legal backend operations.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         # Initialize components
-        self.brief_analyzer = LegalBriefAnalyzer()
+        self.brief_analyzer: LegalBriefAnalyzer = LegalBriefAnalyzer()
         
         # Initialize database connectors
         # In a real implementation, API keys would be loaded from environment variables
         manupatra_api_key = os.getenv("MANUPATRA_API_KEY", "")
         indiankanoon_api_key = os.getenv("INDIANKANOON_API_KEY", "")
         
-        connectors = []
+        connectors: List[LegalDatabaseConnector] = []
         if manupatra_api_key:
             connectors.append(ManupatraConnector(manupatra_api_key))
         if indiankanoon_api_key:
@@ -749,10 +1080,77 @@ class LegalBackendService:
         if not connectors:
             connectors = [ManupatraConnector(""), IndianKanoonConnector("")]
         
-        self.data_aggregator = LegalDataAggregator(connectors)
-        self.analysis_generator = LegalAnalysisGenerator()
+        # Optionally persist connector responses across restarts
+        cache_path = os.getenv("LEGAL_CONNECTOR_CACHE_PATH", "")
+        self.response_cache: Optional[ConnectorResponseCache] = (
+            ConnectorResponseCache(cache_path) if cache_path else None)
+        if self.response_cache is not None:
+            connectors = [CachingConnector(connector, self.response_cache) for connector in connectors]
+        
+        self.data_aggregator: LegalDataAggregator = LegalDataAggregator(connectors)
+        self.analysis_generator: LegalAnalysisGenerator = LegalAnalysisGenerator()
+        
+        # Caches for repeated submissions of the same brief; entries are
+        # deep-copied in and out, so callers may modify what they get back
+        self._analysis_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._search_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+        self._cache_lock = threading.Lock()
+    
+    def _analyze_cached(self, brief_text: str) -> BriefAnalysis:
+        """Analyze a brief, reusing the previous result for identical brief text."""
+        key = _brief_cache_key(brief_text)
+        brief_analysis = self._cached_analysis(key)
+        if brief_analysis is not None:
+            return brief_analysis
+        
+        brief_analysis = self.brief_analyzer.analyze_brief(brief_text)
+        self._store_analysis(key, brief_analysis)
+        return brief_analysis
+    
+    def _cached_analysis(self, key: bytes) -> Optional[BriefAnalysis]:
+        """Return a copy of the cached brief analysis for a key, or None if missing."""
+        with self._cache_lock:
+            brief_analysis = self._analysis_cache.get(key)
+            if brief_analysis is None:
+                return None
+            self._analysis_cache.move_to_end(key)
+        return copy.deepcopy(brief_analysis)
+    
+    def _store_analysis(self, key: bytes, brief_analysis: BriefAnalysis) -> None:
+        """Add a copy of a brief analysis to the LRU cache, evicting the oldest entry if full."""
+        brief_analysis = copy.deepcopy(brief_analysis)
+        with self._cache_lock:
+            self._analysis_cache[key] = brief_analysis
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
     
-    def process_brief(self, brief_text: str) -> Dict[str, Any]:
+    def _search_cached(self, search_params: Dict[str, Any]) -> Tuple[List[LawSection], List[CaseHistory]]:
+        """Search law sections and case histories, reusing recent results for identical parameters."""
+        key = _freeze_params(search_params)
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._search_cache.pop(key, None)
+            if cached is not None and now - cached[0] < SEARCH_CACHE_TTL:
+                self._search_cache[key] = cached
+            else:
+                cached = None
+        if cached is not None:
+            return copy.deepcopy(cached[1]), copy.deepcopy(cached[2])
+        
+        law_sections, case_histories = self.data_aggregator.search_all(search_params)
+        if self.response_cache is not None:
+            self.response_cache.flush()
+        
+        entry = (now, copy.deepcopy(law_sections), copy.deepcopy(case_histories))
+        with self._cache_lock:
+            self._search_cache[key] = entry
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                # Dicts keep insertion order, so the first entry is the least recently used
+                del self._search_cache[next(iter(self._search_cache))]
+        return law_sections, case_histories
+    
+    def process_brief(self, brief_text: str) -> BriefResult:
         """
         Process a legal brief and return relevant information.
         
@@ -762,82 +1160,94 @@ class LegalBackendService:
         Returns:
             Dictionary containing law sections, case histories, and analysis
         """
-        # Analyze the brief
-        brief_analysis = self.brief_analyzer.analyze_brief(brief_text)
+        results: Dict[str, Any] = {}
+        for partial in self.iter_process_brief(brief_text):
+            results.update(partial)
+        return cast(BriefResult, results)
+    
+    def iter_process_brief(self, brief_text: str) -> Iterator[Dict[str, Any]]:
+        """
+        Process a legal brief, yielding each part of the result as soon as it is ready.
         
-        # Prepare search parameters
-        search_params = {
-            "keywords": brief_analysis["keywords"],
-            "acts": brief_analysis["acts"],
-            "sections": brief_analysis["sections"],
-            "domains": brief_analysis["domains"]
-        }
+        Lets a web layer stream the brief analysis to the client while the
+        database searches are still running.
         
-        # Search for relevant law sections
-        law_sections = self.data_aggregator.search_law_sections(search_params)
+        Args:
+            brief_text: The text of the legal brief
+            
+        Yields:
+            Single-key dictionaries for "brief_analysis", "law_sections",
+            "case_histories" and "analysis", in that order
+        """
+        # Analyze the brief (cached by content hash)
+        brief_analysis = self._analyze_cached(brief_text)
+        yield {"brief_analysis": brief_analysis}
         
-        # Search for relevant case histories
-        case_histories = self.data_aggregator.search_case_history(search_params)
+        # Search for relevant law sections and case histories
+        law_sections, case_histories = self._search_cached(self._search_params_for(brief_analysis))
+        yield {"law_sections": law_sections}
+        yield {"case_histories": case_histories}
         
         # Generate analysis
         analysis = self.analysis_generator.generate_analysis(
             brief_analysis, law_sections, case_histories)
+        yield {"analysis": analysis}
+    
+    def process_briefs(self, brief_texts: List[str]) -> List[BriefResult]:
+        """
+        Process several legal briefs in one call.
         
+        Briefs that are not already cached are analyzed together in a single
+        spaCy batch. Briefs that share search parameters share one search.
+        
+        Args:
+            brief_texts: The texts of the legal briefs (at most MAX_BATCH_BRIEFS)
+            
+        Returns:
+            One result dictionary per brief, in input order, each shaped like
+            the return value of process_brief
+        """
+        if len(brief_texts) > MAX_BATCH_BRIEFS:
+            raise ValueError(f"At most {MAX_BATCH_BRIEFS} briefs can be processed per batch")
+        
+        # Analyze uncached briefs in one batch, once per distinct brief
+        keys = [_brief_cache_key(brief_text) for brief_text in brief_texts]
+        pending = {}
+        for key, brief_text in zip(keys, brief_texts):
+            if key not in pending:
+                with self._cache_lock:
+                    cached = key in self._analysis_cache
+                if not cached:
+                    pending[key] = brief_text
+        if pending:
+            analyses = self.brief_analyzer.analyze_briefs(list(pending.values()))
+            for key, brief_analysis in zip(pending, analyses):
+                self._store_analysis(key, brief_analysis)
+        
+        results = []
+        for key, brief_text in zip(keys, brief_texts):
+            brief_analysis = self._cached_analysis(key)
+            if brief_analysis is None:
+                # Evicted by a batch larger than the cache
+                brief_analysis = self._analyze_cached(brief_text)
+            law_sections, case_histories = self._search_cached(self._search_params_for(brief_analysis))
+            analysis = self.analysis_generator.generate_analysis(
+                brief_analysis, law_sections, case_histories)
+            results.append({
+                "brief_analysis": brief_analysis,
+                "law_sections": law_sections,
+                "case_histories": case_histories,
+                "analysis": analysis
+            })
+        
+        return results
+    
+    @staticmethod
+    def _search_params_for(brief_analysis: BriefAnalysis) -> Dict[str, Any]:
+        """Prepare database search parameters from a brief analysis."""
         return {
-            "brief_analysis": brief_analysis,
-            "law_sections": law_sections,
-            "case_histories": case_histories,
-            "analysis": analysis
+            "keywords": _dedupe_terms(brief_analysis["keywords"], lowercase=True),
+            "acts": _dedupe_terms(brief_analysis["acts"]),
+            "sections": _dedupe_terms(brief_analysis["sections"]),
+            "domains": brief_analysis["domains"]
         }
-
-
-# Example usage
-if __name__ == "__main__":
-    # Create the service
-    legal_service = LegalBackendService()
-    
-    # Example brief
-    example_brief = """
-    This case involves a dispute between ABC Corporation and XYZ Ltd regarding a breach of contract. 
-    On January 15, 2024, ABC Corporation entered into an agreement with XYZ Ltd for the supply of 
-    manufacturing equipment worth Rs. 50 lakhs. According to the terms, delivery was to be completed 
-    by March 30, 2024, with a penalty clause for late delivery.
-    
-    XYZ Ltd failed to deliver the equipment by the agreed date and has now refused to honor the penalty 
-    clause, citing force majeure due to supply chain disruptions. However, our investigation reveals that 
-    XYZ Ltd had actually diverted the equipment to another buyer who offered a higher price.
-    
-    We are seeking remedies under Section 73 of the Indian Contract Act, 1872 for breach of contract and 
-    also considering action under Section 420 of the Indian Penal Code for cheating.
-    
-    Previous similar cases include Sharma vs. State of Maharashtra (AIR 2019 SC 1234) where the court 
-    held that diversion of goods to another buyer constitutes cheating.
-    """
-    
-    # Process the brief
-    results = legal_service.process_brief(example_brief)
-    
-    # Print results (in a real application, this would be returned as an API response)
-    print("Brief Analysis:")
-    print(f"Acts: {results['brief_analysis']['acts']}")
-    print(f"Sections: {results['brief_analysis']['sections']}")
-    print(f"Citations: {results['brief_analysis']['citations']}")
-    print(f"Keywords: {results['brief_analysis']['keywords'][:10]}")
-    print(f"Domains: {results['brief_analysis']['domains']}")
-    print("\nLaw Sections:")
-    for section in results['law_sections']:
-        print(f"- {section['title']} Section {section['sectionNumber']} (Relevance: {section['relevance']})")
-    print("\nCase Histories:")
-    for case in results['case_histories']:
-        print(f"- {case['parties']} ({case['citation']}) - Relevance: {case['relevance']}")
-    print("\nAnalysis:")
-    print(f"Summary: {results['analysis']['summary']}")
-    print("Arguments:")
-    for arg in results['analysis']['arguments']:
-        print(f"- {arg}")
-    print("Challenges:")
-    for challenge in results['analysis']['challenges']:
-        print(f"- {challenge}")
-    print("Recommendations:")
-    for rec in results['analysis']['recommendations']:
-        print(f"- {rec}")
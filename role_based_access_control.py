@@ -1,7 +1,16 @@
-import os
-import json
 import logging
-from typing import Dict, Any, Optional, List, Union
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, List, Tuple, Union
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # Configure logging
 logging.basicConfig(
@@ -10,93 +19,395 @@ logging.basicConfig(
 )
 logger = logging.getLogger('role_based_access_control')
 
+# Permission identifiers; call sites should use these rather than string
+# literals, so a misspelt permission fails loudly instead of never matching
+PERM_MANAGE_ALL_USERS = sys.intern('manage_all_users')
+PERM_MANAGE_ADMINS = sys.intern('manage_admins')
+PERM_ASSIGN_ROLES = sys.intern('assign_roles')
+PERM_MANAGE_SUBSCRIPTIONS = sys.intern('manage_subscriptions')
+PERM_CONFIGURE_SYSTEM = sys.intern('configure_system')
+PERM_VIEW_ANALYTICS = sys.intern('view_analytics')
+PERM_MANAGE_CURRENCIES = sys.intern('manage_currencies')
+PERM_MANAGE_API_KEYS = sys.intern('manage_api_keys')
+PERM_ACCESS_ALL_FEATURES = sys.intern('access_all_features')
+PERM_MANAGE_REGULAR_USERS = sys.intern('manage_regular_users')
+PERM_VIEW_BASIC_ANALYTICS = sys.intern('view_basic_analytics')
+PERM_MANAGE_CONTENT = sys.intern('manage_content')
+PERM_MANAGE_OWN_PROFILE = sys.intern('manage_own_profile')
+PERM_ACCESS_TIER_FEATURES = sys.intern('access_tier_features')
+
+# Subscription tiers with paid features
+PAID_TIERS = frozenset({'pro', 'enterprise'})
+
+# Permissions of an unknown role
+_NO_PERMISSIONS = frozenset()
+
+def _freeze(value: Any) -> Any:
+    """
+    Make a read-only copy of nested configuration.
+    
+    Args:
+        value: Configuration made of dicts, lists and scalars
+        
+    Returns:
+        The configuration with dicts as mapping proxies and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Permissions that grant some analytics access, and the data types available
+# with only basic analytics access
+_ANALYTICS_PERMISSIONS = frozenset({PERM_VIEW_ANALYTICS, PERM_VIEW_BASIC_ANALYTICS})
+_BASIC_ANALYTICS_DATA_TYPES = frozenset({'user_count', 'brief_count', 'case_file_count'})
+
+# Mock analytics data by data type
+_MOCK_ANALYTICS_DATA = {
+    'user_count': {
+        'total': 227,
+        'active': 185,
+        'new_last_30_days': 52
+    },
+    'subscription_distribution': {
+        'free': 125,
+        'pro': 78,
+        'enterprise': 24
+    },
+    'revenue': {
+        'current_month': 158743,
+        'previous_month': 142567,
+        'growth_percentage': 11.3
+    },
+    'brief_count': {
+        'total': 1245,
+        'last_30_days': 412
+    },
+    'case_file_count': {
+        'total': 387,
+        'last_30_days': 128
+    }
+}
+
+# Default system settings; API keys come from the environment, read once
+_DEFAULT_SYSTEM_SETTINGS = _freeze({
+    'application_name': 'Lex Assist',
+    'support_email': 'support@lexassist.com',
+    'default_currency': 'INR',
+    'available_currencies': ['INR', 'USD', 'EUR', 'GBP'],
+    'api_keys': {
+        'indian_kanoon': os.environ.get('INDIAN_KANOON_API_KEY', '')
+    }
+})
+
+# Seconds a user's daily search counter is kept in the usage store
+USAGE_COUNTER_TTL = 86400
+
+def _connect_usage_store() -> Any:
+    """
+    Connect to the Redis usage store configured by REDIS_URL.
+    
+    Returns:
+        Redis client, or None if Redis is not installed or configured
+    """
+    redis_url = os.environ.get('REDIS_URL')
+    if redis is None or not redis_url:
+        return None
+    try:
+        return redis.from_url(redis_url)
+    except Exception as e:
+        logger.error(f"Redis connection failed: {e}")
+        return None
+
+# Number of users whose role and subscription are kept, and for how many
+# seconds a cached value is trusted
+USER_CACHE_SIZE = 4096
+USER_CACHE_TTL = 30.0
+
+class TTLCache:
+    """
+    Thread-safe in-memory LRU cache whose entries expire after a fixed time.
+    """
+    
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        """
+        Create an empty cache.
+        
+        Args:
+            maxsize: Maximum number of cached values
+            ttl: Seconds after which a cached value expires
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store a value under a key, evicting the least recently used."""
+        entry = (time.monotonic() + self.ttl, value)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, key: str) -> None:
+        """Drop the cached value for a key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+def _truncate_results(results: Dict[str, Any], key: str, limit: Union[int, float], flag: str) -> None:
+    """
+    Truncate a result list over a tier limit in place and flag it as limited.
+    
+    Args:
+        results: Analysis results
+        key: Key of the list to limit
+        limit: Most items allowed; an unlimited (infinite) limit is never exceeded
+        flag: Key set to True when the list is truncated
+    """
+    items = results.get(key)
+    if items and len(items) > limit:
+        del items[int(limit):]
+        results[flag] = True
+
+def _compute_tier_access(tier: str, tier_limits: Mapping[str, Any]) -> FrozenSet[str]:
+    """
+    Work out the features accessible on a subscription tier.
+    
+    Args:
+        tier: Subscription tier
+        tier_limits: Limits of the tier
+        
+    Returns:
+        Set of accessible features
+    """
+    features = {'pdf_download'}  # Available on all tiers
+    if tier in PAID_TIERS:
+        features.update(['docx_download', 'txt_download', 'sharing'])
+        if len(tier_limits['case_file_types']) > 0:
+            features.add('basic_case_file_drafting')
+    if tier == 'enterprise':
+        features.add('advanced_case_file_drafting')
+    return frozenset(features)
+
+def _get_tier_features(tier: str, tier_limits: Mapping[str, Any]) -> List[str]:
+    """
+    Get the features for a subscription tier.
+    
+    Args:
+        tier: Subscription tier
+        tier_limits: Limits of the tier
+        
+    Returns:
+        List of features
+    """
+    features = []
+    
+    if tier == 'free':
+        features = [
+            'Basic case brief analysis',
+            f"Limited law section results ({tier_limits['max_law_sections']})",
+            f"Limited case history results ({tier_limits['max_case_histories']})",
+            'Basic document generation (PDF only)',
+            f"Limited searches per day ({tier_limits['max_searches_per_day']})"
+        ]
+    elif tier == 'pro':
+        features = [
+            'Advanced case brief analysis',
+            f"Comprehensive law section results ({tier_limits['max_law_sections']})",
+            f"Comprehensive case history results ({tier_limits['max_case_histories']})",
+            'Document generation in all formats',
+            'Basic case file drafting',
+            'Email and WhatsApp sharing',
+            f"Increased searches per day ({tier_limits['max_searches_per_day']})",
+            'Priority processing'
+        ]
+    elif tier == 'enterprise':
+        features = [
+            'All Pro tier features',
+            'Unlimited law section results',
+            'Unlimited case history results',
+            'Advanced case file drafting',
+            'Custom document templates',
+            'API access for integration',
+            'Unlimited searches',
+            'Dedicated support',
+            'Team collaboration features'
+        ]
+    
+    return features
+
+def _build_subscription_plans(subscription_tiers: Mapping[str, Mapping[str, Any]]) -> Tuple[Dict[str, Any], ...]:
+    """
+    Build the subscription plans from the tier definitions.
+    
+    Args:
+        subscription_tiers: Subscription tiers and their limits
+        
+    Returns:
+        Tuple of subscription plans
+    """
+    plans = []
+    
+    for tier, details in subscription_tiers.items():
+        plans.append({
+            'id': tier,
+            'name': tier.capitalize(),
+            'price': details['price'],
+            'currency': details['currency'],
+            'features': tuple(_get_tier_features(tier, details))
+        })
+    
+    return tuple(plans)
+
 class RoleBasedAccessControl:
     """
     Role-based access control system for Lex Assist.
     """
     
-    def __init__(self):
-        """
-        Initialize the RBAC system.
-        """
-        # Define roles and their hierarchy
-        self.roles = {
-            'super_admin': {
-                'level': 3,
-                'description': 'Full access to all features and settings'
-            },
-            'admin': {
-                'level': 2,
-                'description': 'Limited administrative access'
-            },
-            'user': {
-                'level': 1,
-                'description': 'Standard user access'
-            }
+    # The tables below are static configuration shared by every instance, and
+    # read-only
+    
+    # Define roles and their hierarchy
+    roles = _freeze({
+        'super_admin': {
+            'level': 3,
+            'description': 'Full access to all features and settings'
+        },
+        'admin': {
+            'level': 2,
+            'description': 'Limited administrative access'
+        },
+        'user': {
+            'level': 1,
+            'description': 'Standard user access'
         }
-        
-        # Define permissions for each role
-        self.role_permissions = {
-            'super_admin': [
-                'manage_all_users',
-                'manage_admins',
-                'assign_roles',
-                'manage_subscriptions',
-                'configure_system',
-                'view_analytics',
-                'manage_currencies',
-                'manage_api_keys',
-                'access_all_features'
-            ],
-            'admin': [
-                'manage_regular_users',
-                'view_basic_analytics',
-                'manage_content'
-            ],
-            'user': [
-                'manage_own_profile',
-                'access_tier_features'
-            ]
+    })
+    
+    # Define permissions for each role, as sets for constant-time checks
+    role_permissions = MappingProxyType({
+        'super_admin': frozenset({
+            PERM_MANAGE_ALL_USERS,
+            PERM_MANAGE_ADMINS,
+            PERM_ASSIGN_ROLES,
+            PERM_MANAGE_SUBSCRIPTIONS,
+            PERM_CONFIGURE_SYSTEM,
+            PERM_VIEW_ANALYTICS,
+            PERM_MANAGE_CURRENCIES,
+            PERM_MANAGE_API_KEYS,
+            PERM_ACCESS_ALL_FEATURES
+        }),
+        'admin': frozenset({
+            PERM_MANAGE_REGULAR_USERS,
+            PERM_VIEW_BASIC_ANALYTICS,
+            PERM_MANAGE_CONTENT
+        }),
+        'user': frozenset({
+            PERM_MANAGE_OWN_PROFILE,
+            PERM_ACCESS_TIER_FEATURES
+        })
+    })
+    
+    # Define subscription tiers and their features
+    subscription_tiers = _freeze({
+        'free': {
+            'max_searches_per_day': 10,
+            'max_law_sections': 5,
+            'max_case_histories': 5,
+            'document_formats': ['pdf'],
+            'case_file_types': [],
+            'sharing_enabled': False,
+            'price': 0,
+            'currency': '₹'
+        },
+        'pro': {
+            'max_searches_per_day': 50,
+            'max_law_sections': 20,
+            'max_case_histories': 20,
+            'document_formats': ['pdf', 'docx', 'txt'],
+            'case_file_types': ['petition', 'reply'],
+            'sharing_enabled': True,
+            'price': 499,
+            'currency': '₹'
+        },
+        'enterprise': {
+            'max_searches_per_day': float('inf'),  # Unlimited
+            'max_law_sections': float('inf'),  # Unlimited
+            'max_case_histories': float('inf'),  # Unlimited
+            'document_formats': ['pdf', 'docx', 'txt'],
+            'case_file_types': ['petition', 'reply', 'rejoinder', 'affidavit', 'written_statement', 'legal_notice'],
+            'sharing_enabled': True,
+            'price': 4999,
+            'currency': '₹'
         }
+    })
+    
+    # Level of each role, for comparing roles without the nested lookup
+    _role_levels = MappingProxyType({role: details['level'] for role, details in roles.items()})
+    
+    # Features accessible on each tier, worked out once
+    _tier_access = MappingProxyType({tier: _compute_tier_access(tier, limits) for tier, limits in subscription_tiers.items()})
+    
+    # The plans only depend on the tier definitions
+    _subscription_plans = _build_subscription_plans(subscription_tiers)
+    
+    # Roles and subscriptions change rarely, so lookups are reused for a
+    # short time across instances; the write paths below invalidate them
+    # immediately
+    _role_cache = TTLCache()
+    _subscription_cache = TTLCache()
+    
+    # Daily usage counters live in Redis, when configured
+    _usage_store = _connect_usage_store()
+    
+    # Instances carry no state of their own
+    __slots__ = ()
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop the cached role and subscription of a user.
         
-        # Define subscription tiers and their features
-        self.subscription_tiers = {
-            'free': {
-                'max_searches_per_day': 10,
-                'max_law_sections': 5,
-                'max_case_histories': 5,
-                'document_formats': ['pdf'],
-                'case_file_types': [],
-                'sharing_enabled': False,
-                'price': 0,
-                'currency': '₹'
-            },
-            'pro': {
-                'max_searches_per_day': 50,
-                'max_law_sections': 20,
-                'max_case_histories': 20,
-                'document_formats': ['pdf', 'docx', 'txt'],
-                'case_file_types': ['petition', 'reply'],
-                'sharing_enabled': True,
-                'price': 499,
-                'currency': '₹'
-            },
-            'enterprise': {
-                'max_searches_per_day': float('inf'),  # Unlimited
-                'max_law_sections': float('inf'),  # Unlimited
-                'max_case_histories': float('inf'),  # Unlimited
-                'document_formats': ['pdf', 'docx', 'txt'],
-                'case_file_types': ['petition', 'reply', 'rejoinder', 'affidavit', 'written_statement', 'legal_notice'],
-                'sharing_enabled': True,
-                'price': 4999,
-                'currency': '₹'
-            }
-        }
+        Args:
+            user_id: User's ID
+        """
+        self._role_cache.invalidate(user_id)
+        self._subscription_cache.invalidate(user_id)
     
     def get_user_role(self, user_id: str) -> str:
         """
         Get the role of a user.
         
+        Args:
+            user_id: User's ID
+            
+        Returns:
+            User's role
+        """
+        role = self._role_cache.get(user_id)
+        if role is None:
+            role = self._load_user_role(user_id)
+            self._role_cache.put(user_id, role)
+        return role
+    
+    def _load_user_role(self, user_id: str) -> str:
+        """
+        Load the role of a user from storage.
+        
         Args:
             user_id: User's ID
             
@@ -107,7 +418,7 @@ class RoleBasedAccessControl:
         # For now, we'll return a default role
         return 'user'
     
-    def get_user_permissions(self, user_id: str) -> List[str]:
+    def get_user_permissions(self, user_id: str) -> FrozenSet[str]:
         """
         Get the permissions of a user.
         
@@ -115,10 +426,10 @@ class RoleBasedAccessControl:
             user_id: User's ID
             
         Returns:
-            List of permissions
+            Set of permissions
         """
         role = self.get_user_role(user_id)
-        return self.role_permissions.get(role, [])
+        return self.role_permissions.get(role, _NO_PERMISSIONS)
     
     def has_permission(self, user_id: str, permission: str) -> bool:
         """
@@ -131,13 +442,65 @@ class RoleBasedAccessControl:
         Returns:
             True if the user has the permission, False otherwise
         """
-        permissions = self.get_user_permissions(user_id)
-        return permission in permissions
+        return permission in self.get_user_permissions(user_id)
     
     def get_user_subscription(self, user_id: str) -> Dict[str, Any]:
         """
         Get the subscription of a user.
         
+        Args:
+            user_id: User's ID
+            
+        Returns:
+            User's subscription details
+        """
+        # Callers may modify the returned details
+        return dict(self._get_cached_user_subscription(user_id))
+    
+    def _get_cached_user_subscription(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get the subscription of a user through the subscription cache.
+        
+        Args:
+            user_id: User's ID
+            
+        Returns:
+            User's subscription details, shared with the cache
+        """
+        subscription = self._subscription_cache.get(user_id)
+        if subscription is None:
+            subscription = self._load_user_subscription(user_id)
+            self._subscription_cache.put(user_id, subscription)
+        return subscription
+    
+    def _get_user_tier(self, user_id: str) -> str:
+        """
+        Get the subscription tier of a user.
+        
+        Args:
+            user_id: User's ID
+            
+        Returns:
+            User's subscription tier
+        """
+        return self._get_cached_user_subscription(user_id).get('tier', 'free')
+    
+    def _get_user_tier_limits(self, user_id: str) -> Mapping[str, Any]:
+        """
+        Get the limits of the subscription tier of a user.
+        
+        Args:
+            user_id: User's ID
+            
+        Returns:
+            Tier limits
+        """
+        return self.get_tier_limits(self._get_user_tier(user_id))
+    
+    def _load_user_subscription(self, user_id: str) -> Dict[str, Any]:
+        """
+        Load the subscription of a user from storage.
+        
         Args:
             user_id: User's ID
             
@@ -153,7 +516,7 @@ class RoleBasedAccessControl:
             'end_date': None
         }
     
-    def get_tier_limits(self, tier: str) -> Dict[str, Any]:
+    def get_tier_limits(self, tier: str) -> Mapping[str, Any]:
         """
         Get the limits for a subscription tier.
         
@@ -161,7 +524,7 @@ class RoleBasedAccessControl:
             tier: Subscription tier
             
         Returns:
-            Tier limits
+            Read-only tier limits
         """
         return self.subscription_tiers.get(tier, self.subscription_tiers['free'])
     
@@ -176,20 +539,8 @@ class RoleBasedAccessControl:
         Returns:
             True if the user can access the feature, False otherwise
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        
-        if feature == 'pdf_download':
-            return True  # Available on all tiers
-        elif feature in ['docx_download', 'txt_download', 'sharing']:
-            return tier in ['pro', 'enterprise']
-        elif feature == 'basic_case_file_drafting':
-            return tier in ['pro', 'enterprise'] and len(tier_limits['case_file_types']) > 0
-        elif feature == 'advanced_case_file_drafting':
-            return tier == 'enterprise'
-        else:
-            return False
+        features = self._tier_access.get(self._get_user_tier(user_id), self._tier_access['free'])
+        return feature in features
     
     def get_available_document_formats(self, user_id: str) -> List[str]:
         """
@@ -201,10 +552,7 @@ class RoleBasedAccessControl:
         Returns:
             List of available document formats
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('document_formats', ['pdf'])
+        return list(self._get_user_tier_limits(user_id).get('document_formats', ('pdf',)))
     
     def get_available_case_file_types(self, user_id: str) -> List[str]:
         """
@@ -216,10 +564,7 @@ class RoleBasedAccessControl:
         Returns:
             List of available case file types
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('case_file_types', [])
+        return list(self._get_user_tier_limits(user_id).get('case_file_types', ()))
     
     def get_search_limit(self, user_id: str) -> Union[int, float]:
         """
@@ -231,10 +576,7 @@ class RoleBasedAccessControl:
         Returns:
             Search limit
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('max_searches_per_day', 10)
+        return self._get_user_tier_limits(user_id).get('max_searches_per_day', 10)
     
     def get_law_section_limit(self, user_id: str) -> Union[int, float]:
         """
@@ -246,10 +588,7 @@ class RoleBasedAccessControl:
         Returns:
             Law section limit
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('max_law_sections', 5)
+        return self._get_user_tier_limits(user_id).get('max_law_sections', 5)
     
     def get_case_history_limit(self, user_id: str) -> Union[int, float]:
         """
@@ -261,10 +600,7 @@ class RoleBasedAccessControl:
         Returns:
             Case history limit
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('max_case_histories', 5)
+        return self._get_user_tier_limits(user_id).get('max_case_histories', 5)
     
     def is_sharing_enabled(self, user_id: str) -> bool:
         """
@@ -276,10 +612,7 @@ class RoleBasedAccessControl:
         Returns:
             True if sharing is enabled, False otherwise
         """
-        subscription = self.get_user_subscription(user_id)
-        tier = subscription.get('tier', 'free')
-        tier_limits = self.get_tier_limits(tier)
-        return tier_limits.get('sharing_enabled', False)
+        return self._get_user_tier_limits(user_id).get('sharing_enabled', False)
     
     def apply_tier_limits(self, user_id: str, results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -292,18 +625,29 @@ class RoleBasedAccessControl:
         Returns:
             Limited analysis results
         """
-        law_section_limit = self.get_law_section_limit(user_id)
-        case_history_limit = self.get_case_history_limit(user_id)
+        return self.apply_tier_limits_batch(user_id, [results])[0]
+    
+    def apply_tier_limits_batch(self, user_id: str, results_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply subscription tier limits to several analysis results of one user,
+        looking the limits up once.
         
-        if results.get('lawSections') and len(results['lawSections']) > law_section_limit:
-            results['lawSections'] = results['lawSections'][:int(law_section_limit)]
-            results['limitedLawSections'] = True
+        Args:
+            user_id: User's ID
+            results_list: Analysis results
+            
+        Returns:
+            Limited analysis results, in the same order
+        """
+        tier_limits = self._get_user_tier_limits(user_id)
+        law_section_limit = tier_limits.get('max_law_sections', 5)
+        case_history_limit = tier_limits.get('max_case_histories', 5)
         
-        if results.get('caseHistories') and len(results['caseHistories']) > case_history_limit:
-            results['caseHistories'] = results['caseHistories'][:int(case_history_limit)]
-            results['limitedCaseHistories'] = True
+        for results in results_list:
+            _truncate_results(results, 'lawSections', law_section_limit, 'limitedLawSections')
+            _truncate_results(results, 'caseHistories', case_history_limit, 'limitedCaseHistories')
         
-        return results
+        return results_list
     
     def track_usage(self, user_id: str, action_type: str, action_details: Dict[str, Any] = None) -> bool:
         """
@@ -322,10 +666,9 @@ class RoleBasedAccessControl:
         
         if action_type == 'search':
             search_limit = self.get_search_limit(user_id)
-            # Check current search count for the day
-            current_searches = 0  # This would be fetched from the database
-            
-            if current_searches >= search_limit:
+            # Count the search against the day's limit; unlimited tiers
+            # need no counter
+            if search_limit != float('inf') and not self._count_search(user_id, search_limit):
                 return False
         
         # Record the action
@@ -333,73 +676,46 @@ class RoleBasedAccessControl:
         
         return True
     
-    def get_subscription_plans(self) -> List[Dict[str, Any]]:
+    def _count_search(self, user_id: str, search_limit: Union[int, float]) -> bool:
         """
-        Get all subscription plans.
+        Count a search in the user's daily counter with one atomic round trip.
         
+        Args:
+            user_id: User's ID
+            search_limit: Searches allowed per day
+            
         Returns:
-            List of subscription plans
-        """
-        plans = []
-        
-        for tier, details in self.subscription_tiers.items():
-            plans.append({
-                'id': tier,
-                'name': tier.capitalize(),
-                'price': details['price'],
-                'currency': details['currency'],
-                'features': self._get_tier_features(tier)
-            })
+            True if the search is within the limit, False otherwise
+        """
+        if self._usage_store is None:
+            # Without a usage store searches are not counted
+            return True
+        
+        key = f"searches:{user_id}:{time.strftime('%Y%m%d', time.gmtime())}"
+        try:
+            pipe = self._usage_store.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, USAGE_COUNTER_TTL)
+            count, _ = pipe.execute()
+            
+            # A rejected search does not count against the limit
+            if count > search_limit:
+                self._usage_store.decr(key)
+                return False
+        except redis.RedisError as e:
+            logger.error(f"Error counting search for user {user_id}: {e}")
         
-        return plans
+        return True
     
-    def _get_tier_features(self, tier: str) -> List[str]:
+    def get_subscription_plans(self) -> List[Dict[str, Any]]:
         """
-        Get the features for a subscription tier.
+        Get all subscription plans.
         
-        Args:
-            tier: Subscription tier
-            
         Returns:
-            List of features
-        """
-        tier_limits = self.get_tier_limits(tier)
-        
-        features = []
-        
-        if tier == 'free':
-            features = [
-                'Basic case brief analysis',
-                f"Limited law section results ({tier_limits['max_law_sections']})",
-                f"Limited case history results ({tier_limits['max_case_histories']})",
-                'Basic document generation (PDF only)',
-                f"Limited searches per day ({tier_limits['max_searches_per_day']})"
-            ]
-        elif tier == 'pro':
-            features = [
-                'Advanced case brief analysis',
-                f"Comprehensive law section results ({tier_limits['max_law_sections']})",
-                f"Comprehensive case history results ({tier_limits['max_case_histories']})",
-                'Document generation in all formats',
-                'Basic case file drafting',
-                'Email and WhatsApp sharing',
-                f"Increased searches per day ({tier_limits['max_searches_per_day']})",
-                'Priority processing'
-            ]
-        elif tier == 'enterprise':
-            features = [
-                'All Pro tier features',
-                'Unlimited law section results',
-                'Unlimited case history results',
-                'Advanced case file drafting',
-                'Custom document templates',
-                'API access for integration',
-                'Unlimited searches',
-                'Dedicated support',
-                'Team collaboration features'
-            ]
-        
-        return features
+            List of subscription plans
+        """
+        # Copies, so callers may modify the plans
+        return [dict(plan, features=list(plan['features'])) for plan in self._subscription_plans]
     
     def assign_role(self, admin_user_id: str, target_user_id: str, role: str) -> bool:
         """
@@ -413,18 +729,17 @@ class RoleBasedAccessControl:
         Returns:
             True if the role was assigned, False otherwise
         """
-        # Check if the admin user has permission to assign roles
-        if not self.has_permission(admin_user_id, 'assign_roles'):
+        # Check if the role is valid
+        if role not in self._role_levels:
             return False
         
-        # Check if the role is valid
-        if role not in self.roles:
+        # Check if the admin user has permission to assign roles
+        if not self.has_permission(admin_user_id, PERM_ASSIGN_ROLES):
             return False
         
         # Check if the admin user has permission to assign this specific role
-        admin_role = self.get_user_role(admin_user_id)
-        admin_level = self.roles[admin_role]['level']
-        target_level = self.roles[role]['level']
+        admin_level = self._role_levels[self.get_user_role(admin_user_id)]
+        target_level = self._role_levels[role]
         
         # Admin can only assign roles with lower level than their own
         if target_level >= admin_level:
@@ -432,6 +747,7 @@ class RoleBasedAccessControl:
         
         # In a real implementation, this would update the database
         # For now, we'll just return success
+        self.invalidate_user(target_user_id)
         return True
     
     def update_subscription(self, admin_user_id: str, target_user_id: str, tier: str) -> bool:
@@ -447,7 +763,7 @@ class RoleBasedAccessControl:
             True if the subscription was updated, False otherwise
         """
         # Check if the admin user has permission to manage subscriptions
-        if not self.has_permission(admin_user_id, 'manage_subscriptions'):
+        if not self.has_permission(admin_user_id, PERM_MANAGE_SUBSCRIPTIONS):
             return False
         
         # Check if the tier is valid
@@ -456,6 +772,7 @@ class RoleBasedAccessControl:
         
         # In a real implementation, this would update the database
         # For now, we'll just return success
+        self.invalidate_user(target_user_id)
         return True
     
     def get_system_settings(self, user_id: str) -> Dict[str, Any]:
@@ -469,20 +786,17 @@ class RoleBasedAccessControl:
             System settings
         """
         # Check if the user has permission to configure the system
-        if not self.has_permission(user_id, 'configure_system'):
+        if not self.has_permission(user_id, PERM_CONFIGURE_SYSTEM):
             return {}
         
         # In a real implementation, this would fetch settings from the database
-        # For now, we'll return default settings
-        return {
-            'application_name': 'Lex Assist',
-            'support_email': 'support@lexassist.com',
-            'default_currency': 'INR',
-            'available_currencies': ['INR', 'USD', 'EUR', 'GBP'],
-            'api_keys': {
-                'indian_kanoon': 'd053cb3e0082a68b58def9f16e1b43c7a497faf4'
-            }
-        }
+        # For now, we'll return default settings; copies, since callers may
+        # modify them
+        return dict(
+            _DEFAULT_SYSTEM_SETTINGS,
+            available_currencies=list(_DEFAULT_SYSTEM_SETTINGS['available_currencies']),
+            api_keys=dict(_DEFAULT_SYSTEM_SETTINGS['api_keys'])
+        )
     
     def update_system_settings(self, user_id: str, settings: Dict[str, Any]) -> bool:
         """
@@ -496,7 +810,7 @@ class RoleBasedAccessControl:
             True if the settings were updated, False otherwise
         """
         # Check if the user has permission to configure the system
-        if not self.has_permission(user_id, 'configure_system'):
+        if not self.has_permission(user_id, PERM_CONFIGURE_SYSTEM):
             return False
         
         # In a real implementation, this would update the database
@@ -516,7 +830,7 @@ class RoleBasedAccessControl:
             True if the currency was added, False otherwise
         """
         # Check if the user has permission to manage currencies
-        if not self.has_permission(user_id, 'manage_currencies'):
+        if not self.has_permission(user_id, PERM_MANAGE_CURRENCIES):
             return False
         
         # In a real implementation, this would update the database
@@ -535,43 +849,15 @@ class RoleBasedAccessControl:
             Analytics data
         """
         # Check if the user has permission to view analytics
-        if not self.has_permission(user_id, 'view_analytics') and not self.has_permission(user_id, 'view_basic_analytics'):
+        permissions = self.get_user_permissions(user_id)
+        if permissions.isdisjoint(_ANALYTICS_PERMISSIONS):
             return {}
         
         # For basic analytics permission, limit the data types
-        if self.has_permission(user_id, 'view_basic_analytics') and not self.has_permission(user_id, 'view_analytics'):
-            if data_type not in ['user_count', 'brief_count', 'case_file_count']:
-                return {}
+        if PERM_VIEW_ANALYTICS not in permissions and data_type not in _BASIC_ANALYTICS_DATA_TYPES:
+            return {}
         
         # In a real implementation, this would fetch data from the database
         # For now, we'll return mock data
-        if data_type == 'user_count':
-            return {
-                'total': 227,
-                'active': 185,
-                'new_last_30_days': 52
-            }
-        elif data_type == 'subscription_distribution':
-            return {
-                'free': 125,
-                'pro': 78,
-                'enterprise': 24
-            }
-        elif data_type == 'revenue':
-            return {
-                'current_month': 158743,
-                'previous_month': 142567,
-                'growth_percentage': 11.3
-            }
-        elif data_type == 'brief_count':
-            return {
-                'total': 1245,
-                'last_30_days': 412
-            }
-        elif data_type == 'case_file_count':
-            return {
-                'total': 387,
-                'last_30_days': 128
-            }
-        else:
-            return {}
+        data = _MOCK_ANALYTICS_DATA.get(data_type)
+        return dict(data) if data is not None else {}